@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+from collections.abc import Callable
+from zoneinfo import ZoneInfo
+import argparse
+import timeit
+import utils
+
+def measure(cases: dict[str, Callable], rows: int,
+            repeat: int = 3) -> None:
+    width = max(len(name) for name in cases) + 2
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=repeat))
+        rate = utils.style_text(f"{rows / best:>12,.0f}", "green")
+        print(f"{name:<{width}}{best * 1e3:>9.2f} ms{rate} rows/s")
+
+def zones(rows: int) -> None:
+    """DST-aware Timezone vs stdlib zoneinfo, bulk conversions"""
+    from tuikit.zonetools import Timezone
+
+    ours, ref = Timezone("America/New_York"), ZoneInfo(
+                "America/New_York")
+    step  = 4_102_444_800 // rows # spread over 1970-2100
+    utc   = [datetime(1970, 1, 1, tzinfo=timezone.utc) +
+             timedelta(seconds=s) for s in range(0, step *
+             rows, step)]
+    naive = [dt.replace(tzinfo=None) for dt in utc]
+
+    measure({
+        "astimezone  tuikit": lambda: [dt.astimezone(ours.zone)
+                               for dt in utc],
+        "astimezone  zoneinfo": lambda: [dt.astimezone(ref) for
+                                 dt in utc],
+        "utcoffset   tuikit": lambda: [dt.replace(tzinfo=ours.
+                              zone).utcoffset() for dt in naive],
+        "utcoffset   zoneinfo": lambda: [dt.replace(tzinfo=ref
+                                ).utcoffset() for dt in naive],
+        "column      tuikit": lambda: ours.localize_column(naive,
+                              "wall"),
+    }, rows)
+
+def codes(rows: int) -> None:
+    """Control-code checks and escaping vs the old loops"""
+    from tuikit import logictools
+
+    def has_unicode(s): # previous implementation
+        for ch in s:
+            if ord(ch) in [9, 10, 13, 27]: return True
+        return False
+
+    def preserve_codes(s): # previous implementation
+        codes = {"\n": "\\n", "\r": "\\r", "\t": "\\t", 
+                 "\x1b": "\\x1b"}
+        preserved = [ch for ch in s]
+        for c, r in codes.items():
+            for i, ch in enumerate(preserved):
+                if ch == c: preserved[i] = r
+        return "".join(preserved)
+
+    cells = [f"cell {i} of the report" for i in range(rows)]
+    coded = [f"row {i}\tvalue\n\x1b[31m!\x1b[0m" for i in 
+             range(rows)]
+    measure({
+        "has_unicode     old": lambda: [has_unicode(c) for c
+                                   in cells],
+        "has_codes       new": lambda: [logictools.has_codes(
+                                   c) for c in cells],
+        "preserve_codes  old": lambda: [preserve_codes(c) for
+                                    c in coded],
+        "preserve_codes  new": lambda: [logictools.
+                                    preserve_codes(c) for c in
+                                    coded],
+    }, rows)
+
+BENCHES = {"zones": zones, "codes": codes}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks")
+    parser.add_argument("bench", nargs="*", metavar="bench",
+                        help="benchmarks to run: " + ", ".join(
+                        BENCHES) + " (all if none given)")
+    parser.add_argument("-n", "--rows", type=int, default=
+                        100_000, help="rows per benchmark")
+    args = parser.parse_args()
+    if unknown := set(args.bench) - BENCHES.keys():
+        parser.error("unknown benchmark: " + ", ".join(sorted(
+                     unknown)))
+
+    for name in args.bench or BENCHES:
+        print(utils.center(f"《 {name.upper()} 》", "—",
+              "magenta", "green"))
+        print(BENCHES[name].__doc__, end="\n\n")
+        BENCHES[name](args.rows)
+        print()
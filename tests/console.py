@@ -0,0 +1,174 @@
+from tuikit.exceptions import InputError
+from tuikit import console, logictools
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import unittest
+import asyncio
+import queue
+import re
+import io
+
+class Terminal(io.StringIO):
+    def isatty(self): return True
+
+class TestConsole(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(console._CAPS.clear)
+
+    def test_capabilities_cached_per_stream(self):
+        with mock.patch("sys.stdout", io.StringIO()):
+            self.assertEqual(console.capabilities(), {"tty":
+                 False, "ansi": False})
+        term = Terminal()
+        with mock.patch("sys.stdout", term), \
+             mock.patch.dict("os.environ", {"TERM": "xterm"}):
+            self.assertTrue(console.capabilities()["ansi"])
+            with mock.patch.object(term, "isatty") as isatty:
+                console.capabilities()
+                isatty.assert_not_called()
+
+    def test_clear_writes_escapes(self):
+        term = Terminal()
+        with mock.patch("sys.stdout", term), \
+             mock.patch.dict("os.environ", {"TERM": "xterm"}), \
+             mock.patch("os.system") as system:
+            console.clear()
+            system.assert_not_called()
+        # Home, erase the screen, then erase the scrollback
+        self.assertEqual(term.getvalue(), "\033[H\033[2J\033[3J")
+
+    def test_clear_falls_back_to_shell(self):
+        with mock.patch("sys.stdout", io.StringIO()), \
+             mock.patch("os.system") as system:
+            console.clear()
+            system.assert_called_once()
+        term = Terminal()
+        with mock.patch("sys.stdout", term), \
+             mock.patch.dict("os.environ", {"TERM": "dumb"}), \
+             mock.patch("os.system") as system:
+            console.clear()
+            system.assert_called_once()
+
+    def test_screen_redraws_changed_cells(self):
+        out    = io.StringIO()
+        screen = console.Screen(out)
+        frame  = [f"row {i}: {i * 3}" for i in range(20)]
+        size   = logictools.fixed_term_size(40, rows=24)
+        size.__enter__()
+        self.addCleanup(size.__exit__, None, None, None)
+
+        full = screen.draw(frame)
+        self.assertTrue(out.getvalue().startswith(
+             "\033[?25l\033[H\033[2J"))
+        frame[4] = "row 4: 99"
+        written = screen.draw(frame)
+        self.assertEqual(out.getvalue()[full:], "\033[?25l"
+             "\033[5;8H99\033[K\033[21;1H\033[?25h")
+        self.assertLess(written * 10, full)
+        self.assertEqual(screen.draw(frame), 0)
+        screen.draw(frame[:3])
+        self.assertIn("\033[4;1H\033[J", out.getvalue())
+        self.assertEqual(screen.draw("x" * 50 + "\ny"), len(
+             out.getvalue()) - out.getvalue().rindex("\033[?25l"))
+        self.assertEqual(screen.lines, ["x" * 40, "y"])
+        mark = len(out.getvalue())
+        with logictools.fixed_term_size(40, rows=5):
+            screen.draw(frame)
+        self.assertEqual(screen.lines, frame[:5])
+        self.assertNotIn(frame[5], out.getvalue()[mark:])
+
+    def test_screen_without_escapes(self):
+        out = io.StringIO()
+        console.Screen(out, ansi=False).draw(["a", "b"])
+        self.assertEqual(out.getvalue(), "a\nb\n")
+
+    def test_progress_bar_throttles_redraws(self):
+        now  = [0.0]
+        out  = io.StringIO()
+        size = logictools.fixed_term_size(80)
+        size.__enter__()
+        self.addCleanup(size.__exit__, None, None, None)
+        bar = console.ProgressBar(100, label="job", rate=2,
+              window=1, stream=out, clock=lambda: now[0])
+        for _ in range(10):
+            bar.update()
+        self.assertEqual(out.getvalue().count("\r"), 1)
+        now[0] = 0.25
+        bar.update(10)
+        self.assertEqual(out.getvalue().count("\r"), 1)
+        now[0] = 1.0
+        bar.update(10)
+        self.assertEqual(bar.rate(), 29) # window drops t=0
+        self.assertAlmostEqual(bar.eta(), 70 / 29)
+        self.assertEqual(out.getvalue().split("\r")[-1], 
+             "job " + console.make_progress_bar(0.3) + 
+             "  30.0% 30/100 29.0/s 00:02")
+        with bar:
+            for _ in bar.track(range(70)): pass
+        self.assertTrue(out.getvalue().endswith(
+             "100/100 99.0/s 00:00\n"))
+
+    def test_progress_rate_and_wide_labels(self):
+        out = io.StringIO()
+        bar = console.ProgressBar(10, label="漢字", rate=0, 
+              stream=out, clock=lambda: 1.0)
+        for _ in range(3): bar.update()
+        self.assertEqual(out.getvalue().count("\r"), 3)
+        for bad in [-1, "fast"]:
+            with self.assertRaises(InputError):
+                console.ProgressBar(rate=bad)
+        with self.assertRaises(InputError):
+            console.Progress(rate=0)
+
+        out = io.StringIO()
+        with logictools.fixed_term_size(80):
+            progress = console.Progress(stream=out, ansi=False)
+            for label in ["漢字", "\033[31mred\033[0m", "a"]:
+                progress.add(label, total=1).update()
+            progress.draw(final=True)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual({logictools.visual_width(line) for 
+             line in lines}, {len(lines[-1])})
+
+    def test_progress_bar_without_total(self):
+        out = io.StringIO()
+        bar = console.ProgressBar(stream=out, clock=lambda: 2.0)
+        bar.update(1500)
+        self.assertEqual(bar.render(), "1,500 0.0/s")
+        self.assertIsNone(bar.eta())
+
+    def test_progress_counts_threads_and_queues(self):
+        out = io.StringIO()
+        size = logictools.fixed_term_size(80)
+        size.__enter__()
+        self.addCleanup(size.__exit__, None, None, None)
+        with console.Progress(rate=100, stream=out) as progress:
+            fast = progress.add("fast", total=40_000)
+            slow = progress.add("remote")
+            inbox = queue.Queue()
+            progress.listen(inbox)
+            with ThreadPoolExecutor(4) as pool:
+                for _ in range(4): pool.submit(lambda: [
+                    fast.update() for _ in range(10_000)])
+            for _ in range(3): 
+                console.Progress.report(inbox, slow.key, 5)
+        self.assertEqual(fast.count, 40_000)
+        self.assertEqual(slow.count, 15)
+        frame = re.split(r"\033\[\d+A", out.getvalue())[-1]
+        self.assertEqual(frame, "\rfast   " + console.
+             make_progress_bar(1) + " 100.0% 40,000/40,000"
+             "\033[K\n\rremote 15\033[K\n")
+
+    def test_progress_under_asyncio(self):
+        out = io.StringIO()
+        async def main():
+            async with console.Progress(rate=100, stream=out,
+                       ansi=False) as progress:
+                task = progress.add("job", total=3)
+                for _ in range(3):
+                    task.update()
+                    await asyncio.sleep(0)
+        asyncio.run(main())
+        self.assertEqual(out.getvalue(), "job " + console.
+             make_progress_bar(1) + " 100.0% 3/3\n")
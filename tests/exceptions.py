@@ -0,0 +1,18 @@
+from tuikit.exceptions import InputError
+from tuikit import exceptions
+import unittest
+
+class TestExceptions(unittest.TestCase):
+    def test_non_str_cause(self):
+        error = InputError(cause=["\n"], required="x")
+        self.assertIn("'\\\\n' (type: unicode) is not a valid x",
+                      str(error))
+        self.assertEqual(exceptions.preserve_codes(["\n", "a"]),
+             "\\na")
+
+    def test_width_helpers_reject_non_str(self):
+        self.assertEqual(exceptions.visual_width("漢a"), 3)
+        for helper in [exceptions.visual_width, 
+                       exceptions.strip_ansi]:
+            with self.assertRaises(InputError):
+                helper(42)
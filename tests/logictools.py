@@ -1,5 +1,7 @@
 from tuikit import logictools
+from unittest import mock
 import unittest
+import signal
 
 class TestLogicTools(unittest.TestCase):
     def test_any_in(self):
@@ -57,6 +59,21 @@ class TestLogicTools(unittest.TestCase):
         with self.assertRaises(TypeError):
             variance(100, "b")
 
+    def test_visual_width(self):
+        width = logictools.visual_width
+        self.assertEqual(width("hello"), 5)
+        self.assertEqual(width(""), 0)
+        self.assertEqual(width("\x1b[1;32mhello\x1b[0m"), 5)
+        self.assertEqual(width("漢字"), 4)
+        self.assertEqual(width("\x1b[31m日本\x1b[0m語"), 6)
+        self.assertEqual(width("naïve"), 5)
+        self.assertEqual(width("😀"), 2)
+
+    def test_strip_ansi(self):
+        strip = logictools.strip_ansi
+        self.assertEqual(strip("\x1b[4;31mred\x1b[0m"), "red")
+        self.assertEqual(strip("plain"), "plain")
+
     def test_number_padding(self):
         pad_num = logictools.number_padding
         self.assertEqual(pad_num(5), "  5")
@@ -71,4 +88,45 @@ class TestLogicTools(unittest.TestCase):
         with self.assertRaises(TypeError):
             fmt_order("5", deno="2")
         with self.assertRaises(TypeError):
-            fmt_order("5", form=0)
\ No newline at end of file
+            fmt_order("5", form=0)
+
+    def test_fixed_term_size(self):
+        size = logictools.get_term_size()
+        with logictools.fixed_term_size(42):
+            self.assertEqual(logictools.get_term_size(), 42)
+            with logictools.fixed_term_size(7):
+                self.assertEqual(logictools.get_term_size(), 7)
+            self.assertEqual(logictools.get_term_size(True), 42)
+        self.assertEqual(logictools.get_term_size(), size)
+        with self.assertRaises(TypeError):
+            with logictools.fixed_term_size(0): pass
+        with logictools.fixed_term_size(42, rows=9):
+            self.assertEqual(logictools.get_term_rows(), 9)
+        with self.assertRaises(TypeError):
+            with logictools.fixed_term_size(42, rows=0): pass
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), 
+                         "no SIGWINCH")
+    def test_term_size_refreshes_on_resize(self):
+        self.addCleanup(logictools.invalidate_term_size)
+        with mock.patch.dict("os.environ", {"COLUMNS": "50"}
+             ) as env:
+            logictools.invalidate_term_size()
+            self.assertEqual(logictools.get_term_size(), 50)
+            env["COLUMNS"] = "60"
+            self.assertEqual(logictools.get_term_size(), 50)
+            signal.raise_signal(signal.SIGWINCH)
+            self.assertEqual(logictools.get_term_size(), 60)
+            env["COLUMNS"] = "70"
+            logictools.invalidate_term_size()
+            self.assertEqual(logictools.get_term_size(), 70)
+
+    def test_control_codes(self):
+        self.assertTrue(logictools.has_codes("a\tb"))
+        self.assertTrue(logictools.has_codes("\x1b[0m"))
+        self.assertFalse(logictools.has_codes("plain 漢字"))
+        self.assertFalse(logictools.has_codes("\x07bell"))
+        self.assertEqual(logictools.preserve_codes(
+             "a\nb\r\t\x1b"), "a\\nb\\r\\t\\x1b")
+        self.assertEqual(logictools.preserve_codes("\x07"), 
+             "\x07")
@@ -0,0 +1,152 @@
+from tuikit import sink, console, logictools
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import threading
+import unittest
+import time
+import io
+
+class Stream(io.StringIO):
+    """Records each write the sink makes"""
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+class TestSink(unittest.TestCase):
+    def setUp(self):
+        self.out  = Stream()
+        self.sink = sink.Sink(self.out, interval=60)
+        self.addCleanup(self.sink.close)
+        self.addCleanup(sink.route, None)
+
+    def test_lines_stay_whole_across_threads(self):
+        def job(n):
+            for i in range(200):
+                self.sink.write(f"job {n} ")
+                self.sink.write(f"line {i}\n")
+                self.sink.print("done", n, i)
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(job, range(8)))
+        self.sink.flush()
+        lines = self.out.getvalue().splitlines()
+        self.assertEqual(len(lines), 8 * 200 * 2)
+        for line in lines:
+            self.assertRegex(line, r"^(job \d line|done \d) \d+$")
+
+    def test_open_prints_stay_whole_across_threads(self):
+        turns = threading.Barrier(4)
+        def job(n):
+            for i in range(50):
+                for part in f"job {n} line {i}".split():
+                    self.sink.print(part, end=" ", flush=True)
+                    turns.wait() # every thread is mid-line
+                self.sink.print()
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(job, range(4)))
+        self.sink.flush()
+        lines = self.out.getvalue().splitlines()
+        self.assertEqual(len(lines), 200)
+        for line in lines:
+            self.assertRegex(line, r"^job \d line \d+ $")
+
+    def test_partial_line_waits_for_its_end(self):
+        self.sink.write("no end")
+        self.sink.print("whole")
+        self.sink.write("yet")
+        self.sink.flush()
+        self.assertEqual(self.out.getvalue(), "no endwhole\nyet")
+
+    def test_open_lines_of_other_threads_are_kept(self):
+        def worker(text):
+            thread = threading.Thread(target=self.sink.print,
+                     args=(text,), kwargs={"end": ""})
+            thread.start()
+            thread.join()
+        worker("progress 50%")
+        sink.route(self.sink)
+        sink.drain()
+        self.assertEqual(self.out.getvalue(), "progress 50%")
+        worker("done ")
+        self.sink.print("main line")
+        self.sink.close()
+        self.assertEqual(self.out.getvalue(), "progress 50%"
+             "main line\ndone ")
+
+    def test_flush_policies(self):
+        self.sink.print("a")
+        self.sink.print("b")
+        self.assertEqual(self.out.getvalue(), "")
+        self.sink.print("c", flush=True)
+        self.sink.flush()
+        self.assertEqual(self.out.writes, ["a\nb\nc\n"])
+
+        sized = sink.Sink(self.out, size=4, interval=60)
+        for word in ["ab", "cd", "ef"]: sized.print(word)
+        sized.flush()
+        sized.close()
+        self.assertEqual(self.out.writes[1:], ["ab\ncd\n", "ef\n"])
+
+        lined = sink.Sink(Stream(), interval=60, newline=True)
+        lined.write("x\ny")
+        lined.write("z\n")
+        lined.close()
+        self.assertEqual(lined.stream.writes, ["x\n", "yz\n"])
+
+        timed = sink.Sink(Stream(), interval=0.01)
+        timed.print("late")
+        for _ in range(200):
+            if timed.stream.writes: break
+            time.sleep(0.01)
+        self.assertEqual(timed.stream.writes, ["late\n"])
+        timed.close()
+
+    def test_route_and_echo(self):
+        with mock.patch("sys.stdout", io.StringIO()) as stdout:
+            sink.echo("plain", 1)
+            self.assertIs(sink.output(), stdout)
+            self.assertIsNone(sink.route(self.sink))
+            self.assertIs(sink.output(), self.sink)
+            sink.echo("routed", end="!")
+            console.spacer(1)
+            sink.drain()
+            self.assertIs(sink.route(None), self.sink)
+        self.assertEqual(stdout.getvalue(), "plain 1\n")
+        self.assertEqual(self.out.getvalue(), "routed!\n")
+
+    def test_close_restores_plain_printing(self):
+        with mock.patch("sys.stdout", io.StringIO()) as stdout:
+            with sink.Sink(self.out) as out:
+                sink.route(out)
+                sink.echo("inside")
+            self.assertIs(sink.output(), stdout)
+            sink.echo("after block")
+            out.print("late", flush=True)
+            out.write("later\n")
+        self.assertEqual(stdout.getvalue(), "after block\n")
+        self.assertEqual(self.out.getvalue(), "inside\nlate\n"
+             "later\n")
+
+    def test_console_draws_through_sink(self):
+        sink.route(self.sink)
+        size = logictools.fixed_term_size(80)
+        size.__enter__()
+        self.addCleanup(size.__exit__, None, None, None)
+        bar = console.ProgressBar(3, clock=lambda: 1.0)
+        with bar: bar.update(3)
+        sink.drain()
+        self.assertTrue(self.out.getvalue().startswith("\r"))
+        self.assertTrue(self.out.getvalue().endswith(
+             "3/3 0.0/s --:--\n"))
+
+    def test_write_errors_surface_on_flush(self):
+        self.out.close()
+        self.sink.print("lost")
+        with self.assertRaises(ValueError):
+            self.sink.flush()
+        self.sink.flush()
+        with self.assertRaises(TypeError):
+            self.sink.write(b"bytes")
@@ -0,0 +1,163 @@
+from tuikit.exceptions import InputError
+from tuikit import textools, logictools
+from collections.abc import Iterator
+from unittest import mock
+import unittest
+import io
+
+class TestTextTools(unittest.TestCase):
+    def setUp(self):
+        size = mock.patch.object(logictools, "get_term_size",
+               return_value=20)
+        size.start()
+        self.addCleanup(size.stop)
+        self.text = "the quick brown fox jumps over the lazy dog"
+
+    def test_wrap_text(self):
+        wrap = textools.wrap_text
+        self.assertEqual(wrap(self.text), "the quick brown fox"
+             "\njumps over the lazy\ndog")
+        self.assertEqual(wrap(self.text, indent=2), "the quick "
+             "brown fox\n  jumps over the\n  lazy dog")
+        self.assertEqual(wrap("fox", pad=3), "   fox")
+        self.assertEqual(wrap("fox", order="1."), "1. fox")
+        self.assertEqual(wrap(""), "")
+        with self.assertRaises(InputError):
+            wrap(42)
+
+    def test_iter_wrap_streams_lines(self):
+        lines = textools.iter_wrap(io.StringIO(self.text *
+                1000))
+        self.assertEqual(next(lines), "the quick brown fox")
+        self.assertEqual("\n".join(textools.iter_wrap(
+             self.text)), textools.wrap_text(self.text))
+        self.assertEqual(list(textools._words(io.StringIO(
+             " ab  cd\nef "), size=3)), ["ab", "cd", "ef"])
+
+    def test_wrap_from_center(self):
+        lines = textools.wrap_text(self.text, from_center=[
+                "", "-", "", 0]).split("\n")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(len(line) == 20 for line in
+                        lines))
+        self.assertEqual(lines[0].strip("-"),
+             "the quick brown fox")
+
+    def test_center_cuts_overlong_words(self):
+        for word in ["x" * 45, "漢" * 25]:
+            lines = textools.Align().center(word, "-").split(
+                    "\n")
+            self.assertEqual("".join(line.strip("-") for line 
+                 in lines), word)
+            for line in lines:
+                self.assertEqual(logictools.visual_width(line),
+                     20)
+
+    def test_paragraph_reflows_on_resize(self):
+        text = self.text * 3
+        para = textools.Paragraph(text, indent=2, keep=2)
+        for width in [20, 35, 12, 20, 80, 35]:
+            logictools.get_term_size.return_value = width
+            self.assertEqual("\n".join(para.lines(width)),
+                 textools.wrap_text(text, indent=2))
+        self.assertEqual(list(para._flows), [80, 35])
+        self.assertIs(para.lines(35), para.lines(35))
+        self.assertIs(textools.layout(text), textools.layout(
+             text))
+        for line in para.center(30, "-"):
+            self.assertEqual(len(line), 30)
+
+    def test_style(self):
+        warn = textools.Style("yellow", bold=True)
+        self.assertEqual(warn("hi"), "\033[1;33mhi\033[0m")
+        self.assertEqual(warn(7), "\033[1;33m7\033[0m")
+        self.assertEqual(textools.Style()("a\nb"), "a\\nb")
+        self.assertEqual(textools.style_text("hi", "red", 
+             underline=True), "\033[4;31mhi\033[0m")
+        self.assertIs(textools._style("red", "", False, False),
+             textools._style("red", "", False, False))
+        for bad in [dict(fg="nope"), dict(bold=1), 
+                    dict(fg=["red"])]:
+            with self.assertRaises(InputError):
+                textools.style_text("hi", **bad)
+
+    def test_style_many(self):
+        items = ["a", 1, "b\n"]
+        self.assertEqual(textools.style_many(items, "red"), 
+             [textools.style_text(i, "red") for i in items])
+        self.assertEqual(textools.label(items), 
+             [textools.style_text(i, "cyan") for i in items])
+        striped = textools.style_many(items, ["red", 
+                  textools.Style(bold=True)], lazy=True)
+        self.assertIsInstance(striped, Iterator)
+        self.assertEqual(list(striped)[2], 
+             textools.style_text("b\n", "red"))
+        self.assertEqual(textools.styled_join(["a", "b"], 
+             "red", ", "), "\033[31ma\033[0m, \033[31mb\033[0m")
+        self.assertEqual(textools.styled_join(["a", "b"]), "a b")
+        for bad in ["nope", [], [None], None, 3]:
+            with self.assertRaises(InputError):
+                textools.style_many(items, bad)
+        with self.assertRaises(InputError):
+            textools.label("x", hue=None)
+
+    def test_styled_text(self):
+        red  = textools.StyledText("漢字", "red")
+        text = red + " and " + textools.StyledText("more",
+               textools.Style(bold=True))
+        self.assertEqual(text.plain, "漢字 and more")
+        self.assertEqual(text.width, 13)
+        self.assertEqual(logictools.visual_width(text), 13)
+        self.assertEqual(str(text), "\033[31m漢字\033[0m and "
+             "\033[1mmore\033[0m")
+        self.assertEqual(str(text[1:4]), "\033[31m字\033[0m a")
+        self.assertEqual(text[0], textools.StyledText("漢", 
+             "red"))
+        self.assertEqual((red + red).spans, ((0, 4, 
+             textools.Style("red")),))
+        self.assertEqual([str(w) for w in text.split()], [
+             str(red), "and", "\033[1mmore\033[0m"])
+        self.assertEqual(str(text.fill("green")), "\033[31m漢字"
+             "\033[0m\033[32m and \033[0m\033[1mmore\033[0m")
+        centered = textools.Align().center(red, "-")
+        self.assertEqual(centered, "-" * 8 + str(red) + "-" * 8)
+
+    def test_truncate_and_slice_columns(self):
+        red = textools.style_text("hello world", "red")
+        self.assertEqual(textools.truncate(red, 6), 
+             "\033[31mhello…\033[0m")
+        self.assertEqual(textools.truncate(red, 11), red)
+        self.assertEqual(textools.truncate("漢字漢字", 4, "…"),
+             "漢 …")
+        self.assertEqual(textools.truncate("abc", 1, "..."), 
+             ".")
+        self.assertEqual(textools.slice_columns(red, 6), 
+             "\033[31mworld\033[0m")
+        self.assertEqual(textools.slice_columns("漢字ab", 1, 5),
+             " 字a")
+        styled = textools.StyledText("hello world", "red")
+        self.assertEqual(textools.truncate(styled, 6), 
+             textools.StyledText("hello", "red") + "…")
+        self.assertEqual(textools.slice_columns(styled, 0, 5), 
+             textools.StyledText("hello", "red"))
+        with self.assertRaises(InputError):
+            textools.truncate(red, -1)
+
+    def test_markup_template(self):
+        error = textools.markup("[red bold]Error:[/] {msg}")
+        self.assertIs(error, textools.markup(
+             "[red bold]Error:[/] {msg}"))
+        self.assertEqual(error.render(msg="full"), 
+             "\033[1;31mError:\033[0m full")
+        nested = textools.markup("[white on blue]a [underline]"
+                 "b[/] c[/] [[1] [x] {d[k]}")
+        self.assertEqual(nested(d={"k": "v"}), "\033[37;44ma "
+             "\033[0m\033[4;37;44mb\033[0m\033[37;44m c\033[0m "
+             "[1] [x] v")
+        self.assertEqual(textools.markup("[red]hi").render(),
+             "\033[31mhi\033[0m")
+        self.assertEqual(textools.markup("[green]hi[/] {0}"
+             ).center("you", line="-"), "-" * 7 + 
+             "\033[32mhi\033[0m you" + "-" * 7)
+        with self.assertRaises(InputError):
+            textools.markup("oops[/]")
@@ -1,7 +1,15 @@
 from tuikit.exceptions import TimeError, InputError
 from datetime import datetime, timedelta, tzinfo
-from tuikit.zonetools import Timezone
+from tuikit.zonetools import Timezone, localize_file
+from tuikit import __storage__ as storage
+from collections.abc import Iterator
+from unittest import mock
+from array import array
+from pathlib import Path
 import unittest
+import tempfile
+import json
+import pickle
 
 class TestTimezone(unittest.TestCase):    
     def setUp(self):
@@ -34,6 +42,136 @@ class TestTimezone(unittest.TestCase):
             Timezone(30)
             Timezone("UTC+25")
 
+    def test_zone_index_built_once(self):
+        first = storage.index()
+        Timezone("Asia/Tokyo"), Timezone("EST")
+        self.assertIs(storage.index(), first)
+        self.assertEqual(first["offsets"]["EST"], -5)
+        Timezone.reload()
+        self.assertEqual(Timezone("JST").offset, 9)
+
+    def test_binary_table_matches_json(self):
+        index = storage._build({})
+        for name, ofs in index["offsets"].items():
+            self.assertEqual(storage.offset(name), ofs)
+        self.assertEqual(list(storage.zones()), 
+             sorted(index["zones"]))
+        self.assertEqual(list(storage.aliases()), 
+             sorted(index["aliases"]))
+        self.assertIsNone(storage.offset("Fake/Zone"))
+
+    def test_missing_binary_falls_back_to_json(self):
+        binary = storage.BINARY
+        storage.BINARY = binary.with_suffix(".missing")
+        try:
+            storage.reload()
+            self.assertEqual(Timezone("IST").offset, 5.5)
+            self.assertIn("Africa/Harare", 
+                 storage.zones())
+        finally:
+            storage.BINARY = binary
+            storage.reload()
+
+    def test_build_needs_tzif_sources(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+             mock.patch("importlib.resources.files", 
+                        side_effect=ModuleNotFoundError):
+            dest, src = Path(tmp, "tzdata.bin"), Path(tmp, "tz")
+            with mock.patch("zoneinfo.TZPATH", ()):
+                with self.assertRaises(TimeError):
+                    storage.build(dest)
+            self.assertFalse(dest.exists())
+
+            Path(src, "Europe").mkdir(parents=True)
+            Path(src, "Europe", "Paris").write_bytes(
+                 storage._tzif("Europe/Paris"))
+            with mock.patch("zoneinfo.TZPATH", (str(src),)):
+                with self.assertWarns(UserWarning):
+                    storage.build(dest)
+            self.assertTrue(dest.exists())
+
+    def test_stale_binary_is_ignored_after_edits(self):
+        zones, binary = storage.ZONES, storage.BINARY
+        with tempfile.TemporaryDirectory() as tmp:
+            for file in storage.files() + ["tzdata.bin"]:
+                Path(tmp, file).write_bytes(Path(zones, 
+                     file).read_bytes())
+            storage.ZONES, storage.BINARY = Path(tmp), Path(
+                tmp, "tzdata.bin")
+            try:
+                storage.reload()
+                self.assertTrue(storage._table())
+                africa = Path(tmp, "Africa.json")
+                data = json.loads(africa.read_text())
+                data["Africa/Harare"] = 3
+                africa.write_text(json.dumps(data))
+                storage.reload()
+                self.assertFalse(storage._table())
+                self.assertEqual(storage.offset("Africa/Harare"),
+                     3)
+            finally:
+                storage.ZONES, storage.BINARY = zones, binary
+                storage.reload()
+
+    def test_equal_zones_are_interned(self):
+        Timezone.cache_clear()
+        tz = Timezone("Europe/Paris")
+        self.assertIs(Timezone("Europe/Paris"), tz)
+        self.assertIs(Timezone("CET").zone, Timezone(1).zone)
+        self.assertIs(Timezone(1).zone, Timezone("UTC+1"
+             ).zone)
+        self.assertIs(pickle.loads(pickle.dumps(tz)), tz)
+        info = Timezone.cache_info()
+        self.assertEqual(info["timezone"]["hits"], 3)
+        self.assertEqual(info["timezone"]["misses"], 4)
+        self.assertEqual(info["zoneinfo"]["misses"], 1)
+        self.assertEqual(info["zonerules"]["misses"], 1)
+
+    def test_dst_aware_zone(self):
+        tz = Timezone("America/New_York")
+        summer = tz.localize("2024-07-01T12:00:00")
+        winter = tz.localize("2024-01-01T12:00:00")
+        self.assertEqual(summer.utcoffset(), timedelta(
+             hours=-4))
+        self.assertEqual(winter.utcoffset(), timedelta(
+             hours=-5))
+        self.assertEqual(summer.dst(), timedelta(hours=1))
+        self.assertEqual(summer.tzname(), "EDT")
+        # Past the bundled table, the zone's rule takes over
+        self.assertEqual(tz.localize("2090-07-01T12:00:00"
+             ).tzname(), "EDT")
+        # 01:30 happens twice when clocks fall back
+        utc  = datetime(2024, 11, 3, 5, 30, tzinfo=Timezone(
+               "UTC").zone)
+        back = utc.astimezone(tz.zone)
+        self.assertEqual((back.hour, back.fold), (1, 0))
+        back = (utc + timedelta(hours=1)).astimezone(tz.zone)
+        self.assertEqual((back.hour, back.fold), (1, 1))
+        self.assertEqual(tz.converter("CAT")(summer).hour, 18)
+
+    def test_dst_amount_stays_plausible(self):
+        # Apia skipped 2011-12-30 going from -10 (DST) to +14
+        # (DST); its DST is 1h against +13, not 25h
+        apia = datetime(2012, 1, 15, 12, tzinfo=Timezone(
+               "Pacific/Apia").zone)
+        self.assertEqual(apia.utcoffset(), timedelta(hours=14))
+        self.assertEqual(apia.dst(), timedelta(hours=1))
+        self.assertEqual(apia.timetuple().tm_isdst, 1)
+
+    def test_aliases_keep_fixed_offsets(self):
+        for alias, hours in [("UTC", 0), ("GMT", 0), 
+                             ("EST", -5), ("CAT", 2)]:
+            tz = Timezone(alias)
+            self.assertTrue(tz.zone.fixed)
+            for when in ["2024-07-01T12:00:00", 
+                         "1850-01-01T00:00:00"]:
+                dt = tz.localize(when)
+                self.assertEqual(dt.utcoffset(), timedelta(
+                     hours=hours))
+                self.assertEqual(dt.dst(), timedelta(0))
+        self.assertEqual(Timezone("UTC").localize(
+             "1850-01-01T00:00:00").tzname(), "UTC+00:00")
+
     def test_zoneinfo_format(self):
         tz = Timezone("UTC+5.5")
         name = tz.zone.tzname(None)
@@ -52,6 +190,68 @@ class TestTimezone(unittest.TestCase):
         self.assertIsInstance(aliases, list)
         self.assertIn("CAT", aliases)
 
+    def test_match_zones_prefix_slice(self):
+        match = self.tz.match_zones("America/Arg")
+        self.assertEqual(list(match), sorted(z for z in 
+             storage.zones() if z.startswith("America/Arg")))
+        self.assertEqual(match[0], 
+             "America/Argentina/Buenos_Aires")
+        self.assertEqual(len(self.tz.match_zones("Nowhere")),
+             0)
+        self.assertIn("CAT", self.tz.match_zones("ca", 
+             aliased=True))
+
+    def test_zones_at_offset(self):
+        offsets = storage.index()["offsets"]
+        shared  = self.tz.zones_at()
+        self.assertEqual(set(shared), {name for name, ofs in
+             offsets.items() if ofs == 2})
+        self.assertLess(shared.index("Africa/Harare"),
+             shared.index("CAT"))
+        self.assertEqual(self.tz.zones_at("UTC+5.5"),
+             self.tz.zones_at("Asia/Kolkata"))
+        self.assertIn("IST", self.tz.zones_at(5.5))
+        self.assertEqual(self.tz.zones_at(13.75), ())
+
+    def test_zones_at_instant(self):
+        london = Timezone("Europe/London")
+        july   = london.zones_at(at="2024-07-01T12:00:00")
+        self.assertIn("Africa/Lagos", july)
+        self.assertNotIn("Europe/Paris", july)
+        self.assertNotIn("Africa/Abidjan", july)
+        self.assertNotIn("GMT", july)
+        january = london.zones_at(at="2024-01-01T12:00:00")
+        self.assertIn("Africa/Abidjan", january)
+        self.assertIn("GMT", january)
+        self.assertIn("Europe/London", self.tz.zones_at(0,
+             at=1704110400))
+        with self.assertRaises(TimeError):
+            self.tz.zones_at(at=[])
+
+    def test_zones_at_instant_skips_zone_objects(self):
+        Timezone.cache_clear()
+        Timezone("Europe/London").zones_at(at=1720000000)
+        self.assertEqual(Timezone.cache_info()["zonerules"][
+             "misses"], 1)
+        self.assertEqual(storage.offset_at("Europe/London", 
+             1720000000), 3600)
+        self.assertEqual(storage.offset_at("CAT", 0), 7200)
+        self.assertIsNone(storage.offset_at("Fake/Zone", 0))
+
+    def test_fuzzy_search(self):
+        search = Timezone.search
+        for query in ["harare", "Harrae", "hrr", 
+                      "africa/harar"]:
+            self.assertEqual(search(query)[0], 
+                 "Africa/Harare")
+        self.assertEqual(search("new yrok")[0], 
+             "America/New_York")
+        self.assertEqual(search("cat", 1), ["CAT"])
+        self.assertEqual(search("xyz"), [])
+        aliases = self.tz.list_zones(aliased=True, 
+                  getter=True, sort="cat", fuzzy=True)
+        self.assertNotIn("/", "".join(aliases))
+
     def test_list_zones_invalid_kwargs(self):
         with self.assertRaises(InputError):
              self.tz.list_zones(getter=True, 
@@ -101,6 +301,69 @@ class TestTimezone(unittest.TestCase):
         with self.assertRaises(TimeError):
             self.tz.convert("not-a-datetime", "UTC")
 
+    def test_localize_column(self):
+        column = [self.dt_str, self.dt_obj, 1174648500.0]
+        epochs = self.tz.localize_column(column)
+        self.assertEqual(list(epochs), [1174648500.0] * 3)
+        stamps = self.tz.localize_column(column, "datetime")
+        self.assertEqual(stamps, self.tz.localize(
+             [self.dt_str] * 3))
+        wall = self.tz.localize_column(array("d", [0.0]), 
+               "wall")
+        self.assertEqual(wall[0], 7200.0)
+        with self.assertRaises(TimeError):
+            self.tz.localize_column(["invalid-date"])
+        with self.assertRaises(InputError):
+            self.tz.localize_column(column, "fortnight")
+        # Arguments are checked before the column is read
+        read = []
+        lazy = (read.append(v) or v for v in column)
+        with self.assertRaises(InputError):
+            self.tz.convert_column(lazy, "UTC", "fortnight")
+        with self.assertRaises(TimeError):
+            self.tz.convert_column(lazy, "Nowhere")
+        self.assertEqual(read, [])
+
+    def test_convert_column(self):
+        iso = self.tz.convert_column([self.dt_str], "UTC",
+              "iso")
+        self.assertEqual(iso, ["2007-03-23T11:15:00+00:00"])
+
+    def test_converter(self):
+        to_utc = self.tz.converter("UTC")
+        single = to_utc(self.dt_str)
+        self.assertEqual(single, self.tz.convert(
+             self.tz.localize(self.dt_str), "UTC"))
+        self.assertEqual(single.hour, 11)
+        lazy = to_utc(s for s in [self.dt_obj, single])
+        self.assertIsInstance(lazy, Iterator)
+        self.assertEqual(list(lazy), [single, single])
+        with self.assertRaises(TimeError):
+            list(to_utc(["invalid-date"]))
+        with self.assertRaises(TimeError):
+            to_utc(42)
+
+    def test_localize_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = Path(tmp, "in.csv"), Path(tmp, "out.csv")
+            src.write_text(f"id,ts\n1,{self.dt_str}\n")
+            rows = localize_file(src, dst, "ts", to="UTC")
+            self.assertEqual(rows, 1)
+            self.assertEqual(dst.read_text().splitlines(), [
+                 "id,ts", "1,2007-03-23T11:15:00+00:00"])
+            src.write_text("ts\n1174648500\n+1174648500.0\n")
+            localize_file(src, dst, "ts")
+            self.assertEqual(dst.read_text().splitlines()[1:], 
+                 ["2007-03-23T13:15:00+02:00"] * 2)
+
+            src, dst = Path(tmp, "in.jsonl"), Path(tmp, "o")
+            src.write_text('{"ts": 1174648500}\n\n')
+            localize_file(src, dst, "ts", fmt="jsonl")
+            self.assertEqual(json.loads(dst.read_text()), 
+                 {"ts": "2007-03-23T13:15:00+02:00"})
+            with self.assertRaises(InputError):
+                localize_file(src, dst, "id", fmt="jsonl")
+
     def test_iso_now_format(self):
         iso = self.tz.iso_now
         self.assertTrue(isinstance(iso, str))
@@ -1,11 +1,652 @@
+from tuikit.exceptions import TimeError
+from datetime import datetime, timedelta, date
+from calendar import monthrange, isleap
+from collections.abc import Sequence
+from bisect import bisect_left, bisect_right
 from pathlib import Path
+from array import array
+import warnings
+import hashlib
+import struct
+import sys
+import mmap
 import json
 import os
+import re
 
-ZONES = Path(__file__).resolve().parent/"tzdata"
-CONTS = [cont[:-5] for cont in os.listdir(ZONES)]
-FILES = [     file for file in os.listdir(ZONES)]
+ZONES  = Path(__file__).resolve().parent/"tzdata"
+BINARY = ZONES / "tzdata.bin"
+EPOCH  = datetime(1970, 1, 1)
+EPOCH_DAY = EPOCH.toordinal()
+
+# Layout of tzdata.bin (little-endian, built by build()):
+#     header: magic, version, zone, alias, transition,
+#             type and string counts, and a digest of the
+#             JSON it was built from (a stale table is
+#             ignored in favour of the JSON)
+#     uint32 name ends (zones then aliases) into the blob
+#     int32  zone offsets in minutes, one per zone
+#     uint32 alias targets, an index into the zone table
+#            or MISSING when the alias' zone is not bundled
+#     RULE   per zone: first transition, transition count,
+#            first type, type count (0 = fixed offset) and
+#            footer string (NONE = no rule past the table)
+#     int64  transition times (UTC seconds), per zone run
+#     uint8  transition types, relative to the zone's first
+#            type, which is also the type before the table
+#     TYPE   UTC offset and DST seconds, abbreviation string
+#     uint32 string ends (abbreviations, POSIX TZ footers)
+#     utf-8  names blob, zones and aliases each sorted
+#     utf-8  strings blob
+MAGIC   = b"TZDB"
+VERSION = 3
+HEADER  = struct.Struct("<4sHxxIIIII16s")
+RULE    = struct.Struct("<IHHHH")
+TYPE    = struct.Struct("<iiH")
+MISSING = 0xFFFFFFFF
+NONE    = 0xFFFF
+
+# Process-wide zone index, built lazily on first use
+# by index() and dropped by reload(). Keys:
+#     aliases: {"CAT": "Africa/Harare", ...}
+#       conts: {"Africa": ("Africa/Abidjan", ...), ...}
+#       zones: {"Africa/Harare": 2, ...}
+#     offsets: zones plus every alias mapped straight to
+#              its zone's offset, so a lookup is one hit
+_INDEX = {}
+
+# Memory-mapped tzdata.bin and the offsets already found
+# in it. _TABLE stays empty when the file is missing or
+# stale, in which case lookups fall back to the JSON index
+_TABLE = {}
+_FOUND = {}
+_RULES = {}
+
+# PosixRule of each footer string, shared by offset_at()
+_POSIX = {}
+
+# Sorted zone and alias names, decoded once for prefix
+# queries: {"zones": (...), "aliases": (...)}
+_NAMES = {}
+
+# Zones then aliases grouped by UTC offset, built once by
+# sharing(): {2: ("Africa/Blantyre", ..., "CAT", ...), ...}
+_GROUPS = {}
+
+class NameSlice(Sequence):
+    """Read-only view over a run of sorted names"""
+    __slots__ = ("names", "start", "stop")
+
+    def __init__(self, names: tuple, start: int, stop: int):
+        self.names = names
+        self.start = start
+        self.stop  = max(start, stop)
+
+    def __len__(self) -> int: return self.stop - self.start
+
+    def __getitem__(self, i):
+        span = range(self.start, self.stop)[i]
+        if isinstance(span, int): return self.names[span]
+        return [self.names[j] for j in span]
+
+    def __iter__(self):
+        return map(self.names.__getitem__, range(self.start,
+               self.stop))
+
+    def __repr__(self) -> str:
+        return f"NameSlice({list(self)!r})"
+
+def _ttype(offset: int, dst: int, abbr: str) -> tuple:
+    # Zone type: UTC offset and DST as timedeltas, the
+    # abbreviation, and the UTC offset in seconds
+    return (timedelta(seconds=offset), timedelta(seconds=dst),
+            abbr, offset)
+
+class PosixRule:
+    """
+Zone rule from a POSIX TZ string (e.g., "EST5EDT,M3.2.0,
+M11.1.0"), used past the end of a zone's transition table.
+Each year's DST start and end are computed once
+    """
+    PATTERN = re.compile(r"(<[^>]+>|[A-Za-z]+)([+-]?[\d:]+)"
+              r"(?:(<[^>]+>|[A-Za-z]+)([+-]?[\d:]+)?,([^,]+)"
+              r",([^,]+))?$")
+
+    def __init__(self, spec: str):
+        match = self.PATTERN.match(spec)
+        if not match: raise TimeError(cause=spec, required=
+                            "POSIX TZ rule")
+        std, std_off, dst, dst_off, start, end = match.groups()
+        std_off  = -self._clock(std_off)
+        self.std = _ttype(std_off, 0, std.strip("<>"))
+        self.dst = None
+        if not dst: return
+
+        dst_off    = -self._clock(dst_off) if dst_off else (
+                     std_off + 3600)
+        self.diff  = dst_off - std_off
+        self.dst   = _ttype(dst_off, self.diff, dst.strip("<>"))
+        self.start = self._date(start)
+        self.end   = self._date(end)
+        self.years = {}
+
+    def transitions(self, year: int) -> tuple[int, int]:
+        """DST start and end of a year, as wall clock seconds"""
+        try: return self.years[year]
+        except KeyError: pass
+        found = self._epoch(self.start, year), self._epoch(
+                self.end, year)
+        self.years[year] = found
+        return found
+
+    def at_local(self, ts: int, year: int, fold: int) -> tuple:
+        if not self.dst: return self.std
+        start, end = self.transitions(year)
+        # fold picks which side of a gap or repeat ts is on
+        if fold == (self.diff >= 0): end -= self.diff
+        else: start += self.diff
+        return self.dst if self._within(ts, start, end) else (
+               self.std)
+
+    def at_utc(self, ts: int, year: int|None = None) -> tuple:
+        if not self.dst: return self.std, False
+        if year is None: year = (EPOCH + timedelta(seconds=ts)
+                                 ).year
+        start, end = self.transitions(year)
+        start -= self.std[3]
+        end   -= self.dst[3]
+        isdst  = self._within(ts, start, end)
+        if self.diff > 0: lo, hi = end, end + self.diff
+        else: lo, hi = start, start - self.diff
+        return self.dst if isdst else self.std, lo <= ts < hi
+
+    @staticmethod
+    def _within(ts: int, start: int, end: int) -> bool:
+        if start < end: return start <= ts < end
+        return not end <= ts < start
+
+    @staticmethod
+    def _clock(text: str) -> int:
+        sign  = -1 if text.startswith("-") else 1
+        parts = [int(p) for p in text.lstrip("+-").split(":")]
+        parts = (parts + [0, 0])[:3]
+        return sign * (parts[0] * 3600 + parts[1] * 60 + 
+               parts[2])
+
+    def _date(self, text: str) -> tuple:
+        day, _, clock = text.partition("/")
+        clock = self._clock(clock) if clock else 7200
+        if day.startswith("M"):
+            month, week, weekday = map(int, day[1:].split("."))
+            return "M", month, week, weekday, clock
+        if day.startswith("J"): 
+            return "J", int(day[1:]), 0, 0, clock
+        return "N", int(day), 0, 0, clock
+
+    @staticmethod
+    def _epoch(rule: tuple, year: int) -> int:
+        kind, n, week, weekday, clock = rule
+        jan1 = date(year, 1, 1).toordinal()
+        if kind == "M":
+            # weekday 0 is Sunday, week 5 the last such day
+            first, days = monthrange(year, n)
+            day = (weekday - first - 1) % 7 + 1 + 7 * (week-1)
+            if day > days: day -= 7
+            ordinal = date(year, n, day).toordinal()
+        elif kind == "J": # 1-365, February 29 never counts
+            ordinal = jan1 + n - 1 + (isleap(year) and n > 59)
+        else: ordinal = jan1 + n
+        return (ordinal - EPOCH_DAY) * 86400 + clock
 
 def load(file):
     file_path = ZONES / file
-    with open(file_path, "r") as f: return json.load(f)
\ No newline at end of file
+    with open(file_path, "r") as f: return json.load(f)
+
+def files() -> list[str]:
+    return sorted(f for f in os.listdir(ZONES) if
+                  f.endswith(".json"))
+
+def index() -> dict:
+    if not _INDEX: _build()
+    return _INDEX
+
+def reload() -> dict:
+    """
+Drops the zone index and rebuilds it from tzdata. If the
+JSON no longer matches tzdata.bin, lookups fall back to the
+JSON until the table is rebuilt
+    """
+    _INDEX.clear()
+    _FOUND.clear()
+    _NAMES.clear()
+    _RULES.clear()
+    _POSIX.clear()
+    _GROUPS.clear()
+    if _TABLE.get("map"): _TABLE["map"].close()
+    _TABLE.clear()
+    return index()
+
+def offset(name: str) -> int | float | None:
+    """
+Returns the UTC offset of an IANA zone or alias, or None
+if it is unknown. Served from tzdata.bin when present
+    """
+    try: return _FOUND[name]
+    except KeyError: pass
+
+    table = _table()
+    if not table: return index()["offsets"].get(name)
+
+    pos = _position(table, name)
+    if pos is None: return None
+    _FOUND[name] = found = _offset_at(table, pos)
+    return found
+
+def offset_at(name: str, ts: float) -> int | float | None:
+    """
+Returns the UTC offset, in seconds, of an IANA zone or alias
+at UTC epoch time ts, read straight from its transition
+table (fixed-offset zones give their offset). None if the
+name is unknown
+    """
+    found = rules(name)
+    if not found:
+        hours = offset(name)
+        return None if hours is None else hours * 3600
+
+    times, footer = found["times"], found["footer"]
+    if footer and (not times or ts > times[-1]):
+        try: rule = _POSIX[footer]
+        except KeyError: rule = _POSIX.setdefault(footer,
+                                PosixRule(footer))
+        if rule.dst: return rule.at_utc(ts)[0][3]
+    idx = bisect_right(times, ts)
+    return found["types"][found["index"][idx-1] if idx else 0
+           ][0]
+
+def rules(name: str) -> dict | None:
+    """
+Returns the transition table of an IANA zone or alias:
+    zone: Canonical zone name
+    times: array('q') of UTC transition times (seconds)
+    index: type of each transition (bytes)
+    types: [(utc offset, dst seconds, abbreviation), ...]
+           with types[0] in effect before the first time
+    footer: POSIX TZ rule past the last time, or ""
+Returns None for fixed-offset zones, unknown names or when
+tzdata.bin is missing
+    """
+    try: return _RULES[name]
+    except KeyError: pass
+
+    table = _table()
+    pos   = _position(table, name) if table else None
+    if pos is None: return None
+
+    mm = table["map"]
+    first, count, type0, types, footer = RULE.unpack_from(
+        mm, table["rule"] + RULE.size * pos)
+    found = None
+    if types:
+        times = array("q", mm[table["time"] + 8 * first:
+                table["time"] + 8 * (first + count)])
+        if sys.byteorder == "big": times.byteswap()
+        found = {
+            "zone": _name_at(table, pos),
+            "times": times,
+            "index": mm[table["kind"] + first:table["kind"] 
+                     + first + count],
+            "types": [_type_at(table, type0 + i) for i in 
+                      range(types)],
+            "footer": "" if footer == NONE else _string_at(
+                      table, footer)
+        }
+    _RULES[name] = found
+    return found
+
+def zones() -> tuple[str, ...]:
+    """Returns every IANA zone name, sorted"""
+    if "zones" not in _NAMES:
+        table = _table()
+        _NAMES["zones"] = tuple(sorted(index()["zones"]) if
+            not table else (_name_at(table, i) for i in 
+            range(table["zones"])))
+    return _NAMES["zones"]
+
+def aliases() -> tuple[str, ...]:
+    """Returns every zone alias, sorted"""
+    if "aliases" not in _NAMES:
+        table = _table()
+        _NAMES["aliases"] = tuple(sorted(index()["aliases"])
+            if not table else (_name_at(table, i) for i in 
+            range(table["zones"], table["total"])))
+    return _NAMES["aliases"]
+
+def match(prefix: str, aliased: bool = False) -> NameSlice:
+    """Returns the sorted names starting with prefix"""
+    names = aliases() if aliased else zones()
+    start = bisect_left(names, prefix)
+    stop  = bisect_left(names, prefix + chr(0x10FFFF), start)
+    return NameSlice(names, start, stop)
+
+def sharing(hours: int | float) -> tuple[str, ...]:
+    """
+Returns every zone, then every alias, whose standard UTC
+offset (as in the tzdata JSON, ignoring DST) is hours, each
+part sorted. The grouping is computed once for all offsets
+on first use
+    """
+    if not _GROUPS:
+        groups = {}
+        for name in zones() + aliases():
+            ofs = offset(name)
+            if ofs is not None: groups.setdefault(ofs, []
+                                ).append(name)
+        _GROUPS.update((ofs, tuple(names)) for ofs, names in
+                       groups.items())
+    return _GROUPS.get(hours, ())
+
+def build(dest: str | Path = BINARY) -> Path:
+    """
+Compiles the tzdata JSON files into one binary table, with
+each zone's DST transitions read from the system's IANA
+database (zoneinfo.TZPATH) or, failing that, the tzdata
+package. Zones neither has stay fixed, with a warning
+
+Run `python -m tuikit.__storage__` after editing tzdata
+so tzdata.bin does not go stale
+
+Raises:
+    TimeError: If no TZif source is found at all, rather
+               than write a table without DST rules
+    """
+    data   = _build({})
+    zones  = sorted(data["zones"], key=str.encode)
+    alias  = sorted(data["aliases"], key=str.encode)
+    pos    = {zone: i for i, zone in enumerate(zones)}
+
+    blob, ends = b"", []
+    for name in zones + alias:
+        blob += name.encode()
+        ends.append(len(blob))
+
+    mins    = [round(data["zones"][z] * 60) for z in zones]
+    targets = [pos.get(data["aliases"][a], MISSING) for a
+               in alias]
+    total   = len(ends)
+
+    strings, dirs, times, kinds, types = {}, [], [], [], []
+    def string(text: str) -> int:
+        return strings.setdefault(text, len(strings))
+
+    missing = []
+    for zone in zones:
+        source   = _tzif(zone)
+        compiled = source and _compile_rules(source)
+        if source is None: missing.append(zone)
+        if not compiled:
+            dirs.append((len(times), 0, len(types), 0, NONE))
+            continue
+        trans, kind, ztypes, footer = compiled
+        dirs.append((len(times), len(trans), len(types), 
+            len(ztypes), string(footer) if footer else NONE))
+        times += trans
+        kinds += kind
+        types += [(off, dst, string(abbr)) for off, dst, abbr
+                  in ztypes]
+
+    if zones and len(missing) == len(zones):
+        raise TimeError("No TZif sources to compile DST "
+              "rules from", required="system tzdata or the "
+              "tzdata package")
+    if missing: warnings.warn(f"No TZif source for "
+        f"{', '.join(missing)}; they stay fixed", stacklevel=2)
+
+    text, text_ends = b"", []
+    for entry in strings:
+        text += entry.encode()
+        text_ends.append(len(text))
+
+    with open(dest, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(zones),
+                len(alias), len(times), len(types), 
+                len(strings), _digest()))
+        f.write(struct.pack(f"<{total}I", *ends))
+        f.write(struct.pack(f"<{len(mins)}i", *mins))
+        f.write(struct.pack(f"<{len(targets)}I", *targets))
+        for entry in dirs: f.write(RULE.pack(*entry))
+        f.write(struct.pack(f"<{len(times)}q", *times))
+        f.write(bytes(kinds))
+        for entry in types: f.write(TYPE.pack(*entry))
+        f.write(struct.pack(f"<{len(text_ends)}I", *text_ends))
+        f.write(blob)
+        f.write(text)
+
+    return Path(dest)
+
+def _tzif(zone: str) -> bytes | None:
+    # TZif file of a zone: the system IANA database first,
+    # then the tzdata package (as zoneinfo itself does)
+    from importlib.resources import files
+    from zoneinfo import TZPATH
+
+    for root in TZPATH:
+        path = Path(root, zone)
+        if path.is_file(): return path.read_bytes()
+    try:
+        node = files("tzdata") / "zoneinfo"
+        for part in zone.split("/"): node /= part
+        return node.read_bytes()
+    except (ImportError, OSError): return None
+
+def _compile_rules(data: bytes) -> tuple | None:
+    # Reads a zone's TZif data and drops the tail of its
+    # transitions that the POSIX footer rule reproduces,
+    # checking the footer against that tail before trusting
+    # it
+    trans, kinds, ttypes, footer = _read_tzif(data)
+
+    # Drop the big-bang sentinel some files start with; the
+    # type in effect before the first kept transition
+    # becomes type 0
+    before = 0
+    while trans and trans[0] < -2**40:
+        before = kinds[0]
+        trans, kinds = trans[1:], kinds[1:]
+    
+    # Give DST types their DST amount as zoneinfo does: the
+    # offset from the standard time next to the first
+    # transition into them (before it, else after it), or
+    # 1h when neither gives a plausible (up to 2h) amount
+    order, dsts = [before] + kinds, [0] * len(ttypes)
+    for i, k in enumerate(order):
+        off, isdst, _ = ttypes[k]
+        if not isdst or dsts[k]: continue
+        dst = off - ttypes[order[i-1]][0] if i and not ttypes[
+              order[i-1]][1] else 0
+        if not dst and i + 1 < len(order):
+            if ttypes[order[i+1]][1]: continue
+            dst = off - ttypes[order[i+1]][0]
+        if 0 < abs(dst) <= 7200: dsts[k] = dst
+
+    seen, stamped = {}, []
+    for k in order:
+        off, isdst, abbr = ttypes[k]
+        dst = (dsts[k] or 3600) if isdst else 0
+        stamped.append(seen.setdefault((off, dst, abbr), 
+                       len(seen)))
+    types = list(seen)
+    kinds = stamped[1:]
+    if not trans and not types[0][1] and not footer: 
+        return None
+
+    rule = PosixRule(footer) if footer else None
+    def agrees(ts: int, kind: int) -> bool:
+        off, dst, abbr = types[kind]
+        got = rule.at_utc(ts)[0]
+        return (got[3], bool(got[1]), got[2]) == (off, 
+               bool(dst), abbr)
+
+    cut = len(trans)
+    if trans and rule and rule.dst:
+        # Every transition the footer makes over the table's
+        # years, in UTC
+        made, years = set(), range(_year(trans[0]) - 1, 
+                      _year(trans[-1]) + 2)
+        for year in years:
+            start, end = rule.transitions(year)
+            made.update((start - rule.std[3], end - 
+                         rule.dst[3]))
+
+        # Walk back over the transitions the footer remakes,
+        # then keep the first of them in the table so the
+        # footer takes over at a transition of its own
+        while cut > 1 and trans[cut-1] in made and agrees(
+              trans[cut-1], kinds[cut-1]) and agrees(trans[
+              cut-1] - 1, kinds[cut-2]):
+            cut -= 1
+        cut   = min(cut + 1, len(trans))
+        table = set(trans)
+        extra = [t for t in made if trans[cut-1] <= t <= 
+                 trans[-1] and t not in table]
+        if extra: cut = min(len(trans), bisect_left(trans, 
+                            max(extra)) + 1)
+    return trans[:cut], kinds[:cut], types, footer
+
+def _year(ts: int) -> int:
+    return (datetime(1970, 1, 1) + timedelta(seconds=ts)).year
+
+def _read_tzif(data: bytes) -> tuple:
+    # RFC 8536: skip the v1 block, read the 64-bit v2+ one
+    def counts(at: int) -> tuple:
+        return struct.unpack_from(">6l", data, at + 20)
+
+    isut, isstd, leap, ntime, ntype, nchar = counts(0)
+    at = 44 + ntime * 5 + ntype * 6 + nchar + leap * 8 + (
+         isstd + isut)
+    isut, isstd, leap, ntime, ntype, nchar = counts(at)
+    at += 44
+    trans = list(struct.unpack_from(f">{ntime}q", data, at))
+    at   += ntime * 8
+    kinds = list(data[at:at + ntime])
+    at   += ntime
+    raw   = [struct.unpack_from(">lBB", data, at + 6 * i) for
+             i in range(ntype)]
+    at   += ntype * 6
+    chars = data[at:at + nchar]
+    at   += nchar + leap * 12 + isstd + isut
+    types = [(off, bool(dst), chars[i:chars.index(b"\0", i)
+             ].decode()) for off, dst, i in raw]
+    footer = data[at:].strip(b"\n").decode()
+    return trans, kinds, types, footer
+
+def _build(into: dict = _INDEX) -> dict:
+    aliases, conts, zones = {}, {}, {}
+    for file in files():
+        if file == "aliases.json":
+            aliases = load(file)
+            continue
+        data = load(file)
+        conts[file[:-5]] = tuple(data)
+        zones.update(data)
+    offsets = dict(zones)
+    for alias, zone in aliases.items():
+        if zone in zones: offsets[alias] = zones[zone]
+    into.update(aliases=aliases, conts=conts, zones=zones,
+                offsets=offsets)
+    return into
+
+def _digest() -> bytes:
+    # Fingerprint of the tzdata JSON files, names included
+    digest = hashlib.blake2b(digest_size=16)
+    for file in files():
+        digest.update(file.encode() + b"\0")
+        digest.update((ZONES / file).read_bytes())
+    return digest.digest()
+
+def _table() -> dict:
+    if _TABLE: return _TABLE if _TABLE["map"] else {}
+    _TABLE["map"] = None
+    try:
+        with open(BINARY, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.
+                           ACCESS_READ)
+    except (OSError, ValueError): return {}
+
+    try:
+        magic, version, n_zones, n_alias, n_trans, n_types, \
+            n_strs, digest = HEADER.unpack_from(mm)
+    except struct.error: magic = None
+    if magic != MAGIC or version != VERSION or (
+       digest != _digest()):
+        mm.close()
+        return {}
+
+    total = n_zones + n_alias
+    ends  = HEADER.size
+    mins  = ends + 4 * total
+    tgts  = mins + 4 * n_zones
+    rule  = tgts + 4 * n_alias
+    time  = rule + RULE.size * n_zones
+    kind  = time + 8 * n_trans
+    ttype = kind + n_trans
+    strs  = ttype + TYPE.size * n_types
+    blob  = strs + 4 * n_strs
+    text  = blob + struct.unpack_from("<I", mm, ends + 4 * (
+            total - 1))[0] if total else blob
+    _TABLE.update(map=mm, zones=n_zones, total=total,
+        ends=ends, mins=mins, tgts=tgts, rule=rule, time=time,
+        kind=kind, type=ttype, strs=strs, blob=blob, text=text)
+    return _TABLE
+
+def _position(table: dict, name: str) -> int | None:
+    # Zone table position of a zone name or alias
+    if "/" in name: return _search(table, name, 0, 
+                                   table["zones"])
+    pos = _search(table, name, table["zones"], table["total"])
+    if pos is not None: pos = _target_at(table, pos)
+    return None if pos in (None, MISSING) else pos
+
+def _type_at(table: dict, i: int) -> tuple:
+    off, dst, abbr = TYPE.unpack_from(table["map"], 
+                     table["type"] + TYPE.size * i)
+    return off, dst, _string_at(table, abbr)
+
+def _string_at(table: dict, i: int) -> str:
+    mm, strs = table["map"], table["strs"]
+    start = struct.unpack_from("<I", mm, strs + 4 * (i-1)
+            )[0] if i else 0
+    end   = struct.unpack_from("<I", mm, strs + 4 * i)[0]
+    return mm[table["text"] + start:table["text"] + end
+              ].decode()
+
+def _name_bytes(table: dict, i: int) -> bytes:
+    mm, ends = table["map"], table["ends"]
+    start = struct.unpack_from("<I", mm, ends + 4 * (i-1)
+            )[0] if i else 0
+    end   = struct.unpack_from("<I", mm, ends + 4 * i)[0]
+    return mm[table["blob"] + start:table["blob"] + end]
+
+def _name_at(table: dict, i: int) -> str:
+    return _name_bytes(table, i).decode()
+
+def _offset_at(table: dict, i: int) -> int | float:
+    mins = struct.unpack_from("<i", table["map"],
+           table["mins"] + 4 * i)[0]
+    return mins // 60 if not mins % 60 else mins / 60
+
+def _target_at(table: dict, i: int) -> int:
+    i -= table["zones"]
+    return struct.unpack_from("<I", table["map"],
+           table["tgts"] + 4 * i)[0]
+
+def _search(table: dict, name: str, lo: int, hi: int
+            ) -> int | None:
+    key = name.encode()
+    pos = bisect_left(range(lo, hi), key, key=lambda i:
+          _name_bytes(table, i)) + lo
+    if pos < hi and _name_bytes(table, pos) == key:
+        return pos
+    return None
+
+if __name__ == "__main__": print(build())
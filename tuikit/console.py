@@ -1,15 +1,34 @@
-from .textools import style_text, Align
+from .textools import style_text, slice_columns, truncate, Align
+from .exceptions import InputError
+from collections.abc import Iterable, Iterator
+from os.path import commonprefix
+from collections import deque
 from . import logictools  
+from . import sink
+from queue import Empty
+import threading
+import asyncio
+import time
+import sys
 import os
 
+# Like `clear`: \033[H homes the cursor, \033[2J erases the
+# visible screen and \033[3J the scrollback (an xterm 
+# extension; terminals without it ignore the sequence)
+CLEAR = "\033[H\033[2J\033[3J"
+
+# What sys.stdout supports, detected once per stream by 
+# capabilities(): {"stream": ..., "tty": bool, "ansi": bool}
+_CAPS = {}
+
 def spacer(times):
-    for _ in range(times): print()
+    for _ in range(times): sink.echo()
 
 def underline(line: str="—", hue: str="", alone=False):
     term_width = logictools.get_term_size(True)
-    if alone: print()
-    print(style_text(line*term_width, hue))
-    if alone: print()
+    if alone: sink.echo()
+    sink.echo(style_text(line*term_width, hue))
+    if alone: sink.echo()
 
 def make_progress_bar(pct, width=20):
     filled = int(pct * width)
@@ -29,8 +48,408 @@ def rated_bar(pct, width=20):
         
     return line, f"{first}{rate}%{last}"
 
+def capabilities() -> dict:
+    """
+Returns what sys.stdout supports, detected once and cached
+until sys.stdout is replaced:
+    tty: Whether it is a terminal
+    ansi: Whether it obeys ANSI escape sequences
+    """
+    stream = sys.stdout
+    if _CAPS.get("stream") is not stream:
+        try: tty = stream.isatty()
+        except (AttributeError, ValueError): tty = False
+        ansi = tty and os.environ.get("TERM") != "dumb" and (
+               os.name != "nt" or _enable_vt(stream))
+        _CAPS.update(stream=stream, tty=tty, ansi=ansi)
+    return {"tty": _CAPS["tty"], "ansi": _CAPS["ansi"]}
+
 def clear(header=None):
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if capabilities()["ansi"]:
+        out = sink.output()
+        out.write(CLEAR)
+        out.flush()
+    else:
+        sink.drain()
+        os.system('cls' if os.name == 'nt' else 'clear')
     if header:
-        header = Align.center(f"{header}", 0, 1)
-        print(header)
\ No newline at end of file
+        header = Align().center(f"{header}")
+        sink.echo(header)
+
+class Screen:
+    """
+A frame buffer that redraws only what changed since the 
+previous frame. Changed lines are rewritten in place with
+cursor movement (plain lines only from their first changed
+cell) and every frame goes out in one write:
+
+    screen = Screen()
+    while running: screen.draw(render_lines())
+
+Args:
+    stream: Where frames are written (default: the routed
+            sink or sys.stdout, at draw time)
+    ansi (bool | None): Whether the stream obeys escapes 
+                        (default: detected for sys.stdout, 
+                        assumed for other streams). Without
+                        them every frame is written whole
+    """
+    def __init__(self, stream=None, ansi: bool | None = None):
+        self.stream = stream
+        self.ansi   = ansi
+        self.lines  = None
+        self.width  = None
+        self.rows   = None
+
+    def draw(self, frame: str | Iterable[str]) -> int:
+        """
+Shows frame (a string or its lines) and returns the number
+of characters written
+        """
+        lines  = frame.split("\n") if isinstance(frame, str
+                 ) else list(frame)
+        stream = self.stream or sink.output()
+        ansi   = self.ansi if self.ansi is not None else (
+                 self.stream is not None or capabilities()[
+                 "ansi"])
+        if not ansi:
+            out = "\n".join(lines) + "\n"
+        else:
+            # Lines are cut to the width and the frame to the
+            # height, so nothing wraps or scrolls and shifts
+            # the rows the next diff expects
+            width = logictools.get_term_size()
+            rows  = logictools.get_term_rows()
+            if (width, rows) != (self.width, self.rows): 
+                self.reset()
+            self.width, self.rows = width, rows
+            lines = [line if line.isascii() and len(line) <=
+                     width else slice_columns(line, 0, width)
+                     for line in lines[:rows]]
+            out   = self._diff(self.lines, lines)
+        self.lines = lines
+        if out:
+            stream.write(out)
+            stream.flush()
+        return len(out)
+
+    def reset(self) -> None:
+        """Forgets the previous frame so the next draw 
+repaints the whole screen"""
+        self.lines = None
+
+    @staticmethod
+    def _diff(old: list | None, new: list) -> str:
+        # A full repaint erases only the visible screen, so
+        # output above a live Screen stays in the scrollback
+        out = ["\033[H\033[2J"] if old is None else []
+        old = old or []
+        for row, line in enumerate(new, 1):
+            was = old[row-1] if row <= len(old) else ""
+            if line == was: continue
+            col = 0
+            if "\x1b" not in line and "\x1b" not in was:
+                same = len(commonprefix([was, line]))
+                col  = logictools.visual_width(line[:same])
+                line = line[same:]
+            out.append(f"\033[{row};{col + 1}H{line}\033[K")
+        if len(old) > len(new):
+            out.append(f"\033[{len(new) + 1};1H\033[J")
+        if not out: return ""
+        return "\033[?25l" + "".join(out) + (
+               f"\033[{len(new) + 1};1H\033[?25h")
+
+class ProgressBar:
+    """
+A progress bar that redraws itself in place at most rate
+times a second, with throughput and ETA taken over the 
+last window seconds. A tick that does not redraw costs one
+addition and one clock read:
+
+    with ProgressBar(len(rows), label="Import") as bar:
+        for row in rows:
+            work(row)
+            bar.update()
+
+Args:
+    total (int | None): Expected count (None if unknown)
+    label (str): Text before the bar
+    width (int): Bar width in columns
+    rate (float): Maximum redraws per second (0 redraws
+                  on every update)
+    window (float): Seconds of history for rate and ETA
+    stream: Where the bar is drawn (default: the routed 
+            sink or sys.stdout)
+    """
+    def __init__(self, total: int | None = None, label: str 
+                 = "", width: int = 20, rate: float = 10, 
+                 window: float = 5, stream=None, clock=
+                 time.monotonic):
+        if not isinstance(rate, (int, float)) or rate < 0:
+            raise InputError(cause=rate, required="non-"
+                  "negative number")
+        self.total  = total
+        self.label  = label
+        self.width  = width
+        self.every  = 1 / rate if rate else 0
+        self.window = window
+        self.stream = stream
+        self.count  = 0
+        self._clock = clock
+        self._start = clock()
+        self._next  = self._start
+        self._shown = 0
+        self._seen  = deque([(self._start, 0)])
+
+    def update(self, n: int = 1) -> None:
+        """Adds n to the count, redrawing if it is time"""
+        self.count += n
+        now = self._clock()
+        if now >= self._next: self._draw(now)
+
+    def track(self, items: Iterable) -> Iterator:
+        """Yields items, ticking once per item"""
+        for item in items:
+            yield item
+            self.update()
+
+    def close(self) -> None:
+        """Draws the final state and ends the line"""
+        self._draw(self._clock())
+        (self.stream or sink.output()).write("\n")
+
+    def __enter__(self) -> "ProgressBar":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def rate(self, now: float | None = None) -> float:
+        """Items per second over the moving window"""
+        now = self._clock() if now is None else now
+        seen = self._seen
+        while len(seen) > 1 and now - seen[1][0] >= (
+              self.window): seen.popleft()
+        then, count = seen[0]
+        return (self.count - count) / (now - then) if (
+               now > then) else 0.0
+
+    def eta(self, now: float | None = None) -> float | None:
+        """Seconds left at the current rate, if known"""
+        rate = self.rate(now)
+        if self.total is None or not rate: return None
+        return max(self.total - self.count, 0) / rate
+
+    def render(self, now: float | None = None) -> str:
+        """Returns the bar line without drawing it"""
+        now  = self._clock() if now is None else now
+        rate = self.rate(now)
+        head = f"{self.label} " if self.label else ""
+        if self.total:
+            pct  = min(self.count / self.total, 1)
+            eta  = self.eta(now)
+            left = "--:--" if eta is None else _clock_time(eta)
+            return (f"{head}{make_progress_bar(pct, self.width)}"
+                    f" {pct * 100:5.1f}% {self.count:,}/"
+                    f"{self.total:,} {_per_second(rate)} {left}")
+        return f"{head}{self.count:,} {_per_second(rate)}"
+
+    def _draw(self, now: float) -> None:
+        self._next = now + self.every
+        self._seen.append((now, self.count))
+        line   = truncate(self.render(now), 
+                 logictools.get_term_size() - 1, "")
+        width  = logictools.visual_width(line)
+        stream = self.stream or sink.output()
+        stream.write("\r" + line + " " * max(self._shown - 
+                     width, 0))
+        stream.flush()
+        self._shown = width
+
+class ProgressTask:
+    """
+One bar of a Progress display. update() is safe from any
+thread or asyncio task without a lock: each thread adds to
+its own slot, and only the renderer sums them
+    """
+    def __init__(self, key: int, label: str, total: int | 
+                 None = None):
+        self.key     = key
+        self.label   = label
+        self.total   = total
+        self._counts = {}
+        self._remote = 0
+
+    def update(self, n: int = 1) -> None:
+        """Adds n to this task's count"""
+        key, counts = threading.get_ident(), self._counts
+        counts[key] = counts.get(key, 0) + n
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts.copy().values()) + self._remote
+
+    def render(self, width: int = 20, pad: int = 0) -> str:
+        """Returns the bar line of this task"""
+        count = self.count
+        gap   = max(pad - logictools.visual_width(self.label), 0)
+        head  = self.label + " " * (gap + 1)
+        if not self.total: return f"{head}{count:,}"
+        pct = min(count / self.total, 1)
+        return (f"{head}{make_progress_bar(pct, width)} "
+                f"{pct * 100:5.1f}% {count:,}/{self.total:,}")
+
+class Progress:
+    """
+Shows one bar per concurrent task. A single renderer (a 
+thread, or an asyncio task with `async with`) coalesces
+every update into one redraw per interval; workers only 
+touch their task's counter and never write:
+
+    with Progress() as progress:
+        for name in files:
+            task = progress.add(name, total=size(name))
+            pool.submit(download, name, task.update)
+
+Process-pool workers report through a queue instead: pass
+it to listen() and have them call Progress.report(queue, 
+task.key, n).
+
+Args:
+    rate (float): Redraws per second
+    width (int): Bar width in columns
+    stream: Where bars are drawn (default: the routed 
+            sink or sys.stdout)
+    ansi (bool | None): Whether the stream obeys escapes
+                        (default: detected for sys.stdout,
+                        assumed for other streams). Without
+                        them only the final state is written
+    """
+    def __init__(self, rate: float = 10, width: int = 20, 
+                 stream=None, ansi: bool | None = None):
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise InputError(cause=rate, required="positive "
+                  "number")
+        self.every   = 1 / rate
+        self.width   = width
+        self.stream  = stream
+        self.ansi    = ansi
+        self.tasks   = []
+        self._queues = []
+        self._shown  = 0
+        self._stop   = threading.Event()
+        self._runner = None
+
+    def add(self, label: str, total: int | None = None
+            ) -> ProgressTask:
+        """Adds a bar and returns its task"""
+        task = ProgressTask(len(self.tasks), label, total)
+        self.tasks.append(task)
+        return task
+
+    def listen(self, queue) -> None:
+        """Applies (task key, n) updates put on queue"""
+        self._queues.append(queue)
+
+    @staticmethod
+    def report(queue, key: int, n: int = 1) -> None:
+        """Worker side of listen(): reports n for task key"""
+        queue.put((key, n))
+
+    def start(self) -> None:
+        """Starts the renderer thread"""
+        self._stop.clear()
+        self._runner = threading.Thread(target=self._run, 
+                       name="tuikit-progress", daemon=True)
+        self._runner.start()
+
+    def stop(self) -> None:
+        """Stops the renderer and draws the final state"""
+        self._stop.set()
+        if isinstance(self._runner, threading.Thread):
+            self._runner.join()
+        self._runner = None
+        self.draw(final=True)
+
+    async def watch(self) -> None:
+        """Renderer loop for asyncio programs"""
+        while not self._stop.is_set():
+            self.draw()
+            await asyncio.sleep(self.every)
+
+    def draw(self, final: bool = False) -> None:
+        """Redraws every bar in place, in one write"""
+        for queue in self._queues:
+            try:
+                while True:
+                    key, n = queue.get_nowait()
+                    self.tasks[key]._remote += n
+            except Empty: pass
+
+        ansi = self.ansi if self.ansi is not None else (
+               self.stream is not None or capabilities()[
+               "ansi"])
+        if not ansi and not final: return
+        tasks = list(self.tasks)
+        pad   = max((logictools.visual_width(task.label) for 
+                    task in tasks), default=0)
+        cols  = logictools.get_term_size() - 1
+        lines = [truncate(task.render(self.width, pad), cols,
+                 "") for task in tasks]
+        if ansi: out = (f"\033[{self._shown}A" if self._shown
+                  else "") + "".join(f"\r{line}\033[K\n" for 
+                  line in lines)
+        else: out = "".join(line + "\n" for line in lines)
+        stream = self.stream or sink.output()
+        stream.write(out)
+        stream.flush()
+        self._shown = len(lines)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.every): self.draw()
+
+    def __enter__(self) -> "Progress":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    async def __aenter__(self) -> "Progress":
+        self._stop.clear()
+        self._runner = asyncio.get_running_loop().create_task(
+                       self.watch())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._stop.set()
+        await self._runner
+        self._runner = None
+        self.draw(final=True)
+
+def _per_second(rate: float) -> str:
+    for unit in ["", "k", "M"]:
+        if rate < 1000: return f"{rate:.1f}{unit}/s"
+        rate /= 1000
+    return f"{rate:.1f}G/s"
+
+def _clock_time(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours: return f"{hours}:{minutes:02}:{seconds:02}"
+    return f"{minutes:02}:{seconds:02}"
+
+def _enable_vt(stream) -> bool:
+    # Windows consoles obey escapes once virtual terminal
+    # processing is switched on for their handle
+    try:
+        import ctypes, msvcrt
+        kernel = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode   = ctypes.c_uint32()
+        if not kernel.GetConsoleMode(handle, ctypes.byref(
+               mode)): return False
+        return bool(kernel.SetConsoleMode(handle, mode.value
+                    | 0x0004))
+    except (ImportError, AttributeError, OSError, ValueError):
+        return False
\ No newline at end of file
@@ -3,10 +3,9 @@ from datetime import datetime as dt
 from math import floor, ceil, sqrt
 from typing import NoReturn, Any
 from . import logictools
-import unicodedata
+from . import sink
 import textwrap
 import time
-import re
 
 def _notify(msg:str, fg: str|None, bg: str|None, bold:bool, 
             underline:bool, inline:bool, spaced:bool, 
@@ -22,7 +21,7 @@ def _notify(msg:str, fg: str|None, bg: str|None, bold:bool,
         if not spaced: msg = centered_msg
         else: msg = f"\n{centered_msg}\n"
     
-    if not write: print(msg)
+    if not write: sink.echo(msg)
     
     if isinstance(write, str) and path.isfile(write):
         with open(write, "a") as file:
@@ -108,7 +107,7 @@ Prints the exception message in red, optionally inline, centered, or underlined.
         msg = self.msg
         if centered: msg = center(msg)
         msg_colored = color(msg, fg, bg, bold, underline)
-        print(msg_colored, end='' if inline else '\n')
+        sink.echo(msg_colored, end='' if inline else '\n')
     
     @staticmethod
     def mod_error_tag(error:str) -> str:
@@ -233,32 +232,18 @@ Returns:
 
 def strip_ansi(s: str) -> str:
     if not isinstance(s, str): __err__(s, "string") 
-    return re.sub(r'\x1B[@-_][0-?]*[ -/]*[@-~]','',s)
+    return logictools.strip_ansi(s)
 
 def visual_width(s: str) -> int:
-    clean = strip_ansi(s)
-    width = 0
-    for ch in clean:
-        width += 2 if unicodedata.east_asian_width(ch) in [
-                 'F', 'W'] else 1
-    return width
+    if not isinstance(s, str): __err__(s, "string") 
+    return logictools.visual_width(s)
 
 def preserve_codes(s: str) -> str:
-    codes = {
-          "\n": "\\n",
-          "\r": "\\r",
-          "\t": "\\t",
-        "\x1b": "\\x1b"
-    }
-        
-    preserved = [ch for ch in s]
-    for c, r in codes.items():
-        for i, ch in enumerate(preserved):
-            if ch == c: preserved[i] = r
-                
-    return "".join(preserved)
+    if isinstance(s, str): return logictools.preserve_codes(s)
+    return "".join(logictools.preserve_codes(ch) for ch in s)
 
 def has_unicode(s: str) -> bool:
+    if isinstance(s, str): return logictools.has_codes(s)
     try:      
         for ch in s:
             if isunicode(ch): return True
@@ -270,7 +255,7 @@ def isunicode(s: str) -> bool:
 
 def underline() -> None:
     term_width = logictools.get_term_width()
-    print(color("—"*term_width, "magenta")) 
+    sink.echo(color("—"*term_width, "magenta")) 
 
 def color(text, fg: str|None = None, bg: str|None = None, 
           bold:bool = False, underline:bool = False)-> str:
@@ -344,4 +329,7 @@ def wrap_text(text:str, indent:int = 0, pad:int = 0,
                 word) + margin / (2 if margin >= 2 
                 else 1)
     
-    return result
\ No newline at end of file
+    return result
+
+def __err__(cause, required: str):
+    raise InputError(cause=cause, required=required)
@@ -5,11 +5,12 @@ from .exceptions import ListError
 from typing import Any
 from math import ceil
 from . import console
+from . import sink
 import random
 
 def choose(options:dict, cursor:str = ">>>",
           hue:str = "magenta", getch:bool = False,
-          src=None, proxy:bool = False):
+          src=None, proxy:bool = False, search=None):
     """
 Custom input menu for choosing an option from a list
 
@@ -44,10 +45,15 @@ Args:
                     function was called by another
                     function/method. See Habitrax for
                     example
+    search (callable): Optional finder for typed, non-numeric
+                       input (e.g., Timezone.search). Its
+                       matches that are keys of options
+                       get listed with their numbers
     """
-    print(f"{format_order(len(options)+1,form=' ')}. Back")
+    sink.echo(f"{format_order(len(options)+1,form=' ')}. Back")
     while True:
         try:
+            sink.drain()
             choice = input(style_text(cursor, hue))
             choice = int(choice) - 1
             if 0 <= choice < len(options):
@@ -56,6 +62,15 @@ Args:
                 else: pick_from(options, choice)()
                 break
         except ValueError:
+            if search and choice != "clear":
+                keys  = list(options)
+                found = [key for key in search(choice) if 
+                         key in options]
+                for key in found:
+                    pos = format_order(keys.index(key) + 1, 
+                          form=" ")
+                    sink.echo(f"{pos}. {key}")
+                if found: continue
             if choice == "clear" and src:
                 if proxy:
                     console.clear()
@@ -66,7 +81,7 @@ Args:
                 return
         if choice == len(options):
             if src:
-                print()
+                sink.echo()
                 underline()
             return
         exceptions.warning(f"Choose a number between 1 "
@@ -118,12 +133,12 @@ Args:
         indent = deno + 1
     
     if guide:
-        print(style_text(guide, underline=1)+":")
+        sink.echo(style_text(guide, underline=1)+":")
     for opt, item in enumerate(items):
         if style:
             order = format_order(style(opt), deno, " ")
-        print(wrap_text(item, indent, order=order))
-        if spaced: print()
+        sink.echo(wrap_text(item, indent, order=order))
+        if spaced: sink.echo()
 
 def flatten(data, to=list) -> list|tuple:
     """
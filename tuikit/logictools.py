@@ -1,8 +1,30 @@
+from contextlib import contextmanager
+from functools import lru_cache
 import unicodedata
 import random
 import shutil
+import threading
+import signal
 import re
 
+ANSI = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
+
+# Control characters shown as their escapes, not obeyed,
+# when text is styled (e.g., "\n" -> "\\n")
+_CODE = re.compile("[\n\r\t\x1b]")
+
+# Column width of every BMP codepoint (1 or 2), filled in
+# once on the first non-ASCII width query. Codepoints past
+# the BMP are rare and asked of unicodedata directly
+_WIDTHS = bytearray()
+
+# Terminal geometry shared by the whole process. "size" is
+# the cached os.terminal_size, dropped on SIGWINCH or by
+# invalidate_term_size(); it is only kept while our SIGWINCH
+# handler is installed. "fixed" stacks fixed_term_size()
+# overrides as (columns, rows or None)
+_TERM = {"fixed": []}
+
 def any_in(*args, eq=None) -> bool:
     if len(args) == 1:
         args = args[0]
@@ -77,18 +99,120 @@ def shave(num: int | float, limit: int | float) -> tuple:
     return round(shaved), major
 
 def get_term_size(width: bool = False) -> int:
-    if not width:
-        return shutil.get_terminal_size().columns or 80
-    return shutil.get_terminal_size((80, 20)).columns or 80
+    """
+Returns the terminal width in columns. The first call from
+the main thread installs a SIGWINCH handler (chaining any
+previous one) so the size can be cached until the terminal
+is resized; without one, every call asks the terminal
+    """
+    if _TERM["fixed"]: return _TERM["fixed"][-1][0]
+    return _term_size(width).columns or 80
+
+def get_term_rows() -> int:
+    """Returns the terminal height in rows, cached and 
+refreshed as get_term_size() is"""
+    if _TERM["fixed"] and _TERM["fixed"][-1][1]: 
+        return _TERM["fixed"][-1][1]
+    return _term_size(False).lines or 24
+
+def _term_size(width: bool) -> tuple:
+    size = _TERM.get("size")
+    if size is None:
+        size = shutil.get_terminal_size((80, 24) if not width
+               else (80, 20))
+        if _watch_resize(): _TERM["size"] = size
+    return size
+
+def invalidate_term_size() -> None:
+    """Drops the cached terminal size (e.g., after COLUMNS
+changes); the next get_term_size() asks the terminal"""
+    _TERM.pop("size", None)
+
+@contextmanager
+def fixed_term_size(columns: int, rows: int | None = None):
+    """
+Makes get_term_size() return columns (and get_term_rows()
+rows, if given) inside the block, for rendering without a
+terminal (e.g., reports, tests)
+    """
+    for value in [columns, 1 if rows is None else rows]:
+        if not isinstance(value, int) or value < 1:
+            raise TypeError("columns and rows should be "
+                            +"positive integers")
+    _TERM["fixed"].append((columns, rows))
+    try: yield columns
+    finally: _TERM["fixed"].pop()
+
+def _watch_resize() -> bool:
+    # Installs the SIGWINCH handler once, chaining any
+    # previous one. Fails where there is no SIGWINCH and,
+    # until retried from there, outside the main thread
+    if "watching" not in _TERM:
+        if threading.current_thread() is not (
+           threading.main_thread()): return False
+        try: _TERM["previous"] = signal.signal(
+             signal.SIGWINCH, _on_resize)
+        except AttributeError: _TERM["watching"] = False
+        except ValueError: return False
+        else: _TERM["watching"] = True
+    return _TERM["watching"]
+
+def _on_resize(signum, frame) -> None:
+    _TERM.pop("size", None)
+    previous = _TERM.get("previous")
+    if callable(previous): previous(signum, frame)
 
 def visual_width(s: str) -> int:
-    clean = strip_ansi(s)
+    """
+Returns the terminal columns s occupies, ignoring ANSI
+escape codes and counting East Asian wide and fullwidth
+characters as two columns. Styled text objects (anything
+that is not a str) report their own width
+    """
+    if not isinstance(s, str): return s.width
+    if s.isascii() and "\x1b" not in s: return len(s)
+    return _width(s)
+
+def char_width(ch: str) -> int:
+    """Returns the terminal columns of one character"""
+    cp = ord(ch)
+    if cp < 0x80: return 1
+    if cp < 0x10000:
+        if not _WIDTHS: _fill_widths()
+        return _WIDTHS[cp]
+    return 2 if unicodedata.east_asian_width(ch) in "FW" else 1
+
+@lru_cache(maxsize=4096)
+def _width(s: str) -> int:
+    if "\x1b" in s: s = ANSI.sub("", s)
+    if s.isascii(): return len(s)
+    if not _WIDTHS: _fill_widths()
+
     width = 0
-    for ch in clean:
-        width += 2 if unicodedata.east_asian_width(
-            ch) in ['F', 'W'] else 1
+    for cp in map(ord, s):
+        width += _WIDTHS[cp] if cp < 0x10000 else 2 if (
+                 unicodedata.east_asian_width(chr(cp)) in 
+                 "FW") else 1
     return width
 
+def _fill_widths() -> None:
+    _WIDTHS.extend(2 if unicodedata.east_asian_width(chr(cp))
+                   in "FW" else 1 for cp in range(0x10000))
+
+def has_codes(s: str) -> bool:
+    """Whether s holds a newline, return, tab or escape"""
+    return not s.isprintable() and _CODE.search(s) is not None
+
+def preserve_codes(s: str) -> str:
+    """Replaces newlines, returns, tabs and escapes in s
+with their printable escapes"""
+    # One isprintable() pass clears ordinary text; chained
+    # replace() beats str.translate, whose multi-character
+    # targets take CPython's slow path
+    if s.isprintable(): return s
+    return s.replace("\n", "\\n").replace("\r", "\\r").replace(
+           "\t", "\\t").replace("\x1b", "\\x1b")
+
 def number_padding(num, pad=3):
     return str(num).rjust(pad)
 
@@ -114,4 +238,4 @@ def variance(new: int|float, old: int|float)->int|float:
     else: return 100
 
 def strip_ansi(s: str) -> str:
-    return re.sub(r'\x1B[@-_][0-?]*[ -/]*[@-~]','',s)
+    return ANSI.sub("", s) if "\x1b" in s else s
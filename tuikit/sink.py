@@ -0,0 +1,197 @@
+from queue import SimpleQueue, Empty
+import threading
+import atexit
+import time
+import sys
+
+# Sink that tuikit output goes through, set by route().
+# None means plain print() to sys.stdout
+_ACTIVE = None
+
+# Queue markers: flush without waiting / stop the writer
+_FLUSH = object()
+_CLOSE = object()
+
+class Sink:
+    """
+A single writer thread behind a queue. Any thread can write
+or print to it; the writer batches what it receives and
+writes it out once enough has built up (size), once the
+oldest pending text has waited long enough (interval) or,
+with newline=True, at the end of every line. Text reaches
+the stream in whole lines, never interleaved mid-line: a
+line a thread has not ended yet is held until it does,
+that thread calls flush(), or close() or drain() write out
+every thread's open line. Once closed, a sink writes
+straight to its stream:
+
+    with Sink() as out:
+        sink.route(out)
+        ...                # tuikit output now goes to out
+                           # until the block closes it
+
+Args:
+    stream: Where text is written (default: sys.stdout at
+            write time)
+    size (int): Characters buffered before a write
+    interval (float): Seconds text may wait before a write
+    newline (bool): If True, write at every line end
+    """
+    def __init__(self, stream=None, size: int = 8192,
+                 interval: float = 0.05, newline: bool = False):
+        self.stream   = stream
+        self.size     = size
+        self.interval = interval
+        self.newline  = newline
+        self._queue   = SimpleQueue()
+        self._lock    = threading.Lock()
+        self._open    = {}   # thread ident -> its open line
+        self._error   = None
+        self._closed  = False
+        self._writer  = threading.Thread(target=self._run,
+                        name="tuikit-sink", daemon=True)
+        self._writer.start()
+
+    def write(self, text: str) -> int:
+        """
+File-like write. Text up to the last newline is queued at
+once; the rest waits, per thread, for its line to end
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, "
+                            f"not {type(text).__name__}")
+        if self._closed: return (self.stream or sys.stdout
+                                 ).write(text)
+        ident = threading.get_ident()
+        with self._lock:
+            held = self._open.pop(ident, "") + text
+            end  = held.rfind("\n") + 1
+            if end: self._queue.put(held[:end])
+            if held[end:]: self._open[ident] = held[end:]
+        return len(text)
+
+    def print(self, *values, sep: str = " ", end: str = "\n",
+              flush: bool = False) -> None:
+        """
+Like print(), through write(). flush=True writes out the
+lines queued so far without waiting; a line left open (as
+with end="") still waits for its end
+        """
+        self.write(sep.join(map(str, values)) + end)
+        if not flush: return
+        if self._closed: self.flush()
+        else: self._queue.put(_FLUSH)
+
+    def flush(self) -> None:
+        """
+Writes everything queued so far, plus this thread's open
+line, and waits for it
+        """
+        if self._closed: return (self.stream or sys.stdout
+                                 ).flush()
+        self._release(threading.get_ident())
+        self._wait()
+
+    def close(self) -> None:
+        """
+Flushes every thread's open line, stops the writer thread
+and, if this sink is the routed one, restores plain 
+printing
+        """
+        if _ACTIVE is self: route(None)
+        if self._closed: return
+        self._release()
+        self._wait()
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._writer.join()
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _release(self, ident: int | None = None) -> None:
+        # Queues one thread's open line, or all of them
+        with self._lock:
+            if ident is None: held, self._open = list(
+                              self._open.values()), {}
+            else: held = [self._open.pop(ident, "")]
+            for text in held:
+                if text: self._queue.put(text)
+
+    def _wait(self) -> None:
+        # Waits until the writer has written everything put
+        # on the queue before this call
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.1):
+            if not self._writer.is_alive(): break
+        self._raise()
+
+    def _raise(self) -> None:
+        error, self._error = self._error, None
+        if error is not None: raise error
+
+    def _run(self) -> None:
+        pending, size, due = [], 0, None
+        while True:
+            wait = None if due is None else max(due -
+                   time.monotonic(), 0)
+            try: item = self._queue.get(timeout=wait)
+            except Empty: item = _FLUSH
+
+            if isinstance(item, str):
+                pending.append(item)
+                size += len(item)
+                if due is None: due = time.monotonic() + (
+                                      self.interval)
+                if size < self.size and not (self.newline and
+                   item.endswith("\n")): continue
+            if pending or item is not _CLOSE:
+                self._emit(pending)
+                pending, size, due = [], 0, None
+            if isinstance(item, threading.Event): item.set()
+            elif item is _CLOSE: return
+
+    def _emit(self, pending: list) -> None:
+        stream = self.stream or sys.stdout
+        try:
+            if pending: stream.write("".join(pending))
+            stream.flush()
+        except Exception as error: self._error = error
+
+def route(target: Sink | None) -> Sink | None:
+    """
+Sends tuikit output through target (None restores plain
+printing) and returns the sink it replaces
+    """
+    global _ACTIVE
+    previous, _ACTIVE = _ACTIVE, target
+    return previous
+
+def output():
+    """Returns where tuikit writes: the routed sink or
+sys.stdout"""
+    return _ACTIVE or sys.stdout
+
+def echo(*values, sep: str = " ", end: str = "\n",
+         flush: bool = False) -> None:
+    """print() through the routed sink, if there is one"""
+    target = _ACTIVE
+    if target is None: print(*values, sep=sep, end=end,
+                             flush=flush)
+    else: target.print(*values, sep=sep, end=end,
+                       flush=flush)
+
+def drain() -> None:
+    """Waits until routed output, open lines of every thread
+included, is written (e.g., before input() shows a prompt
+or the interpreter exits)"""
+    target = _ACTIVE
+    if target is None or target._closed: return
+    target._release()
+    target._wait()
+
+atexit.register(drain)
@@ -1,9 +1,15 @@
 from tuikit.exceptions import validate, InputError
+from collections.abc import Iterator, Iterable
+from functools import partial, lru_cache
+from collections import OrderedDict
 from tuikit import logictools
-import unicodedata
+from tuikit import sink
+from itertools import cycle, chain
+from math import inf
 import textwrap
-import time
 import re
+import io
+import time
 
 class Align:
     def right(self, arg: str) -> str:
@@ -22,7 +28,7 @@ class Align:
             err=__err__
         )
         
-        arg = str(arg)
+        if not isinstance(arg, StyledText): arg = str(arg)
         
         term_width = logictools.get_term_size(69) # ;)
         vis_width  = logictools.visual_width(arg)
@@ -36,9 +42,10 @@ class Align:
 
         left   = style_text(line *  left_pad, line_hue)
         right  = style_text(line * right_pad, line_hue)
-        middle = style_text(arg, hue)
+        middle = style_text(arg, hue) if isinstance(arg, str
+                 ) else str(arg.fill(hue) if hue else arg)
         
-        if len(arg) > term_width:
+        if vis_width > term_width:
             if pad: total_pad += pad * 2
             return wrap_text(middle, from_center=[hue, 
                 line, line_hue, total_pad]) 
@@ -52,17 +59,16 @@ class Align:
         )
         return wrap_text(str(arg), pad, pad)
 
+ALIGN = Align()
+
 def strip_ansi(s: str) -> str:
     if not isinstance(s, str): __err__(s, "string") 
-    return re.sub(r'\x1B[@-_][0-?]*[ -/]*[@-~]','',s)
+    return logictools.strip_ansi(s)
 
 def visual_width(s: str) -> int:
-    clean = strip_ansi(s)
-    width = 0
-    for ch in clean:
-        width += 2 if unicodedata.east_asian_width(
-            ch) in ['F', 'W'] else 1
-    return width
+    if isinstance(s, StyledText): return s.width
+    if not isinstance(s, str): __err__(s, "string") 
+    return logictools.visual_width(s)
 
 def pluralize(n: int | float, word: str) -> str:
     # Validate parameters
@@ -78,62 +84,603 @@ def pluralize(n: int | float, word: str) -> str:
             return word[:-1]+"ies"
         return word + 's'
 
+COLORS = {
+    "black": 30, "red": 31, "green": 32, 
+    "yellow": 33, "blue": 34, "magenta": 35,
+    "cyan": 36, "white": 37,
+    "gray": 90, "lightred": 91, "lightgreen": 92,
+    "lightyellow": 93, "purple": 94,
+    "lightmagenta": 95, "lightcyan": 96
+}
+
+class Style:
+    """
+A reusable text style whose escape codes are built once,
+so applying it is plain string concatenation:
+
+    warn = Style("yellow", bold=True)
+    print(warn("careful"))
+
+Args:
+    fg (str): Foreground color name (see COLORS)
+    bg (str): Background color name
+    underline (bool): If True, underline the text
+    bold (bool): If True, embolden the text
+
+Raises:
+    InputError: If a color or flag is invalid
+    """
+    __slots__ = ("fg", "bg", "underline", "bold", "prefix",
+                 "suffix")
+
+    def __init__(self, fg: str = "", bg: str = "",
+                 underline: bool = False, bold: bool = False):
+        validate(
+            [[fg, bg], str, "color"],
+            [[underline, bold], bool, "boolean"],
+            err=__err__
+        )
+        for c in [fg, bg]:
+            if c and c not in COLORS: __err__(c, "color")
+
+        style = []
+        if bold: style.append("1")
+        if underline: style.append("4")
+        if fg: style.append(str(COLORS[fg]))
+        if bg: style.append(str(COLORS[bg] + 10))
+
+        self.fg, self.bg = fg, bg
+        self.underline, self.bold = underline, bold
+        self.prefix = f"\033[{';'.join(style)}m" if style else ""
+        self.suffix = "\033[0m" if style else ""
+
+    def __call__(self, text) -> str:
+        if text.__class__ is not str: text = str(text)
+        if not text.isprintable(): 
+            text = logictools.preserve_codes(text)
+        return self.prefix + text + self.suffix
+
+    def __repr__(self) -> str:
+        return (f"Style(fg={self.fg!r}, bg={self.bg!r}, "
+                f"underline={self.underline}, bold={self.bold})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Style): return NotImplemented
+        return self.prefix == other.prefix
+
+    def __hash__(self) -> int:
+        return hash(self.prefix)
+
+class StyledText:
+    """
+Text kept as plain characters plus (start, end, Style)
+spans. Width, slicing and concatenation work on the plain
+text and shift spans, so escape codes are never parsed;
+they are only written out by str()
+
+Args:
+    text (str): Plain text (escape codes are not parsed)
+    style (Style | str | None): Style or color name for
+                                all of the text
+    """
+    __slots__ = ("plain", "spans", "_width")
+
+    def __init__(self, text: str = "", style: Style | str | 
+                 None = None):
+        if not isinstance(text, str): __err__(text, "string")
+        style = None if style is None else _resolve(style)
+        self.plain  = text
+        self.spans  = ((0, len(text), style),) if text and (
+                      style and style.prefix) else ()
+        self._width = None
+
+    @classmethod
+    def _of(cls, plain: str, spans: tuple) -> "StyledText":
+        self = cls.__new__(cls)
+        self.plain, self.spans, self._width = plain, spans, None
+        return self
+
+    @property
+    def width(self) -> int:
+        """Terminal columns of the text"""
+        if self._width is None:
+            self._width = logictools.visual_width(self.plain)
+        return self._width
+
+    def __len__(self) -> int:
+        return len(self.plain)
+
+    def __str__(self) -> str:
+        plain, out, pos = self.plain, [], 0
+        for start, end, style in self.spans:
+            if pos < start: out.append(plain[pos:start])
+            out.append(style(plain[start:end]))
+            pos = end
+        out.append(plain[pos:])
+        return "".join(out)
+
+    def __repr__(self) -> str:
+        return f"StyledText({self.plain!r}, spans={self.spans})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StyledText): return NotImplemented
+        return (self.plain, self.spans) == (other.plain, 
+                other.spans)
+
+    def __hash__(self) -> int:
+        return hash((self.plain, self.spans))
+
+    def __add__(self, other) -> "StyledText":
+        if isinstance(other, str): other = StyledText(other)
+        if not isinstance(other, StyledText): return NotImplemented
+        return StyledText("").join([self, other])
+
+    def __radd__(self, other) -> "StyledText":
+        if not isinstance(other, str): return NotImplemented
+        return StyledText(other) + self
+
+    def __getitem__(self, key) -> "StyledText":
+        size = len(self.plain)
+        if isinstance(key, int):
+            if not -size <= key < size: 
+                raise IndexError("StyledText index out of range")
+            key %= size
+            key  = slice(key, key + 1)
+        if not isinstance(key, slice): __err__(key, "index")
+        start, stop, step = key.indices(size)
+        if step != 1: __err__(key, "slice without step")
+        if stop <= start: return StyledText()
+        spans = tuple((max(s, start) - start, min(e, stop) - 
+                start, style) for s, e, style in self.spans if
+                s < stop and e > start)
+        return StyledText._of(self.plain[start:stop], spans)
+
+    def join(self, parts: Iterable) -> "StyledText":
+        """Like str.join, keeping every part's spans"""
+        plain, spans, pos = [], [], 0
+        for i, part in enumerate(parts):
+            if isinstance(part, str): part = StyledText(part)
+            elif not isinstance(part, StyledText):
+                __err__(part, "string or StyledText")
+            for piece in ((self, part) if i else (part,)):
+                for s, e, style in piece.spans:
+                    s, e = s + pos, e + pos
+                    if spans and spans[-1][1] == s and (
+                       spans[-1][2] == style):
+                        s = spans.pop()[0]
+                    spans.append((s, e, style))
+                plain.append(piece.plain)
+                pos += len(piece.plain)
+        return StyledText._of("".join(plain), tuple(spans))
+
+    def split(self) -> list["StyledText"]:
+        """Whitespace-separated words, keeping their spans"""
+        words, pos = [], 0
+        for word in self.plain.split():
+            pos = self.plain.find(word, pos)
+            words.append(self[pos:pos + len(word)])
+            pos += len(word)
+        return words
+
+    def fill(self, style: Style | str) -> "StyledText":
+        """Returns a copy with the unstyled gaps in style"""
+        style = _resolve(style)
+        if not style.prefix: return self
+        spans, pos = [], 0
+        for span in self.spans + ((len(self.plain),) * 2 + (
+                                  None,),):
+            if pos < span[0]: spans.append((pos, span[0], style))
+            if span[2] is not None: spans.append(span)
+            pos = span[1]
+        return StyledText._of(self.plain, tuple(spans))
+
+@lru_cache(maxsize=256, typed=True)
+def _style(fg: str, bg: str, underline: bool, bold: bool
+           ) -> Style:
+    return Style(fg, bg, underline, bold)
+
 def style_text(text, fg: str = "", bg: str = "",
                underline: bool = False,
                bold: bool = False) -> str:
+    # Styles are validated once and then served from cache;
+    # unhashable arguments go straight to Style to fail
+    try: style = _style(fg, bg, underline, bold)
+    except TypeError: style = Style(fg, bg, underline, bold)
+    return style(text)
+
+def style_many(items: Iterable, style: Style | str | 
+               Iterable = "", lazy: bool = False
+               ) -> list[str] | Iterator[str]:
+    """
+Styles a whole iterable at once, resolving and validating
+the style once per batch instead of once per item
+
+Args:
+    items (Iterable): Values to style (converted to str)
+    style: A Style, a color name, or a sequence of these
+           applied item by item, repeating if shorter 
+           (e.g., ["cyan", "white"] for striped rows)
+    lazy (bool): If True, yield the strings as they are
+                 styled instead of returning a list
+
+Returns:
+    list[str] | Iterator[str]: The styled strings
+
+Raises:
+    InputError: If a style is invalid or none are given
+    """
+    validate([[style], [str, Style, Iterable], "style or "
+              "styles"], err=__err__)
+    styles = [_resolve(s) for s in style] if not isinstance(
+             style, (str, Style)) else [_resolve(style)]
+    if not styles: __err__(style, "style or styles")
     
+    styled = map(styles[0], items) if len(styles) == 1 else (
+             apply(item) for apply, item in zip(cycle(styles),
+             items))
+    return styled if lazy else list(styled)
+
+def styled_join(items: Iterable, style: Style | str = "",
+                sep: str = " ") -> str:
+    """
+Styles items and joins them with an unstyled sep, opening
+and closing the style once per gap instead of per item
+    """
+    style = _resolve(style)
+    if not isinstance(sep, str): __err__(sep, "string")
+    if not style.prefix: return sep.join(map(style, items))
+    gap = style.suffix + sep + style.prefix
+    return style.prefix + gap.join(map(_resolve(""), items)
+           ) + style.suffix
+
+class Template:
+    """
+A markup template compiled once into a format string with
+its escape codes already in place, so rendering is just 
+str.format:
+
+    error = markup("[red bold]Error:[/] {msg}")
+    print(error.render(msg="disk full"))
+
+Tags are colors, "bold", "underline" and "on <color>" for
+the background, e.g. "[white on red]". Tags nest, "[/]" 
+closes the innermost one and "[[" is a literal "[". Square
+brackets holding anything else are left as text, and {...}
+fields follow str.format
+
+Args:
+    source (str): The markup
+
+Raises:
+    InputError: If source is not a string or closes a tag
+                that was never opened
+    """
+    __slots__ = ("source", "format", "plain")
+    TOKEN = re.compile(r"\{\{|\}\}|\{(?:[^{}]|\{[^{}]*\})*\}|"
+                       r"\[\[|\[/[^\]]*\]|\[[^\[\]]*\]")
+
+    def __init__(self, source: str):
+        if not isinstance(source, str): __err__(source, 
+                                                "string")
+        NONE  = ("", "", False, False)
+        fmt, plain, stack, pos = [], [], [NONE], 0
+        
+        def shift(new: tuple):
+            # Escape codes taking the text from the current
+            # style to new
+            old = _style(*stack[-1]).prefix
+            if old: fmt.append("\033[0m")
+            fmt.append(_style(*new).prefix)
+
+        for token in self.TOKEN.finditer(source):
+            text = source[pos:token.start()]
+            fmt.append(text)
+            plain.append(text)
+            pos, tag = token.end(), token.group()
+            if tag.startswith("[/"):
+                if len(stack) == 1: __err__(tag, 
+                                            "opening tag")
+                shift(stack[-2])
+                stack.pop()
+            elif tag == "[[": 
+                fmt.append("[")
+                plain.append("[")
+            elif tag[0] == "[" and (new := self._tag(tag[1:-1],
+                                    stack[-1])):
+                shift(new)
+                stack.append(new)
+            else:
+                fmt.append(tag)
+                plain.append(tag)
+        fmt.append(source[pos:])
+        plain.append(source[pos:])
+        if len(stack) > 1: shift(NONE)
+
+        self.source = source
+        self.format = "".join(fmt)
+        self.plain  = "".join(plain)
+
+    def render(self, *args, **values) -> str:
+        """Fills in the {fields} of the compiled template"""
+        return self.format.format(*args, **values)
+
+    __call__ = render
+
+    def center(self, *args, line: str = " ", line_hue: 
+               str = "", **values) -> str:
+        """
+Renders the template centered on the terminal, measuring
+the unstyled text instead of stripping the styled one
+        """
+        left, total, right = ALIGN.center(self.plain.format(
+                             *args, **values), get_pad=True)
+        fill = _resolve(line_hue)
+        return fill(line * left) + self.render(*args, **values
+               ) + fill(line * right)
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+    @staticmethod
+    def _tag(tag: str, outer: tuple) -> tuple | None:
+        # Style of a tag nested in outer, or None when the
+        # brackets are not a tag
+        fg, bg, underline, bold = outer
+        words = iter(tag.split())
+        for word in words:
+            if word in COLORS: fg = word
+            elif word == "bold": bold = True
+            elif word == "underline": underline = True
+            elif word == "on" and (bg := next(words, "")
+                 ) in COLORS: continue
+            else: return None
+        return (fg, bg, underline, bold) if tag.strip() else None
+
+@lru_cache(maxsize=256)
+def markup(source: str) -> Template:
+    """Returns the compiled, shared Template of source"""
+    return Template(source)
+
+def _resolve(style: Style | str) -> Style:
+    if isinstance(style, Style): return style
+    if not isinstance(style, str): __err__(style, "style")
+    return _style(style, "", False, False)
+
+def slice_columns(text: str | StyledText, start: int = 0,
+                  end: int | None = None) -> str | StyledText:
+    """
+Returns the terminal columns [start, end) of text in one
+pass. Escape codes are all kept, so styles still open and
+reset, and a wide character cut in half becomes a space
+
+Args:
+    text (str | StyledText): Text to slice
+    start (int): First column to keep
+    end (int | None): Column to stop at (default: the end)
+
+Returns:
+    str | StyledText: The slice, same type as text
+    """
     validate(
-        [[fg, bg], str, "color"],
-        [[underline, bold], bool, "boolean"],
-        err=__err__
-    )
-    
-    text = str(text)
-    if has_unicode(text): text = preserve_codes(text)
-    
-    colors = {
-        "black": 30, "red": 31, "green": 32, 
-        "yellow": 33, "blue": 34, "magenta": 35,
-        "cyan": 36, "white": 37,
-        "gray": 90, "lightred": 91, "lightgreen": 92,
-        "lightyellow": 93, "purple": 94,
-        "lightmagenta": 95, "lightcyan": 96
-    }
-
-    for c in [fg, bg]:
-        if c and c not in colors: __err__(c, "color")
-    
-    style = []
-    
-    if bold: style.append("1")
-    if underline: style.append("4")
-    if fg: style.append(str(colors[fg]))
-    if bg: style.append(str(colors[bg] + 10))
+      [start, int, "natural number", "less", 0],
+      [[end if end is not None else start], int, 
+       "natural number", "less", 0], err=__err__)
+    if end is not None: end = max(end, start)
+    if isinstance(text, StyledText):
+        first, last, lead, trail = _span(text.plain, start, end)
+        return " " * lead + text[first:last] + " " * trail
+    if not isinstance(text, str): __err__(text, "string")
+
+    out, col, pos = [], 0, 0
+    for match in logictools.ANSI.finditer(text):
+        if end is None or col < end:
+            col = _take(text[pos:match.start()], col, start,
+                        end, out)
+        out.append(match.group())
+        pos = match.end()
+    if end is None or col < end: _take(text[pos:], col, 
+                                       start, end, out)
+    return "".join(out)
+
+def truncate(text: str | StyledText, width: int, 
+             ellipsis: str = "…") -> str | StyledText:
+    """
+Fits text into width columns, ending it with ellipsis when
+it is too wide. Text that fits is returned unchanged, and
+escape codes (e.g., the closing reset) are kept
 
-    if style:
-        return f"\033[{';'.join(style)}m{text}\033[0m"
+Args:
+    text (str | StyledText): Text to fit
+    width (int): Maximum columns
+    ellipsis (str): Marker for the cut (shortened to fit)
+
+Returns:
+    str | StyledText: The fitted text, same type as text
+    """
+    validate(
+      [width, int, "natural number", "less", 0],
+      [ellipsis, str, "string"], err=__err__)
+    if logictools.visual_width(ellipsis) > width:
+        ellipsis = slice_columns(ellipsis, 0, width)
+    room = width - logictools.visual_width(ellipsis)
+
+    if isinstance(text, StyledText):
+        if text.width <= width: return text
+        _, last, _, trail = _span(text.plain, 0, room)
+        return text[:last] + " " * trail + ellipsis
+    if not isinstance(text, str): __err__(text, "string")
+
+    col, pos, cut, ascii = 0, 0, None, text.isascii()
+    for match in chain(logictools.ANSI.finditer(text), 
+                       [None]):
+        stop = match.start() if match else len(text)
+        if ascii or text[pos:stop].isascii():
+            if cut is None and col + stop - pos > room:
+                cut, fill = pos + room - col, 0
+            col += stop - pos
+        else:
+            for i in range(pos, stop):
+                size = logictools.char_width(text[i])
+                if cut is None and col + size > room:
+                    cut, fill = i, room - col
+                col += size
+                if col > width: break
+        if col > width: return text[:cut] + " " * fill + (
+           ellipsis + "".join(logictools.ANSI.findall(text,
+           cut)))
+        if match: pos = match.end()
     return text
 
+def _take(run: str, col: int, start: int, end: int | None,
+          out: list) -> int:
+    # Appends the part of run within columns [start, end),
+    # run starting at column col; returns the column after
+    if run.isascii():
+        stop = len(run) if end is None else end - col
+        if start - col < stop: out.append(run[max(start - 
+                                   col, 0):stop])
+        return col + len(run)
+    for ch in run:
+        size = logictools.char_width(ch)
+        if col >= start and (end is None or col + size <= end):
+            out.append(ch)
+        elif col + size > start and (end is None or col < end):
+            out.append(" " * (min(col + size, col + size if
+                       end is None else end) - max(col, start)))
+        col += size
+        if end is not None and col >= end: break
+    return col
+
+def _span(plain: str, start: int, end: int | None) -> tuple:
+    # Character range of plain text covering columns 
+    # [start, end), plus the spaces standing in for wide
+    # characters cut at either edge
+    first = last = len(plain)
+    lead = trail = col = 0
+    for i, ch in enumerate(plain):
+        size = logictools.char_width(ch)
+        if first == len(plain) and col + size > start:
+            first, lead = (i, 0) if col >= start else (i + 1,
+                (col + size if end is None else min(col + 
+                size, end)) - start)
+        if end is not None and col + size > end:
+            last  = i
+            trail = max(end - max(col, start), 0) if (
+                    i >= first) else 0
+            break
+        col += size
+    return first, max(last, first), lead, trail
+
 def wrap_text(text: str, indent: int = 0, pad: int = 0, 
               inline: bool = False, order: str = '', 
               from_center: list = []) -> str:
-    
+    return "\n".join(iter_wrap(text, indent, pad, inline, 
+                     order, from_center))
+
+def iter_wrap(text, indent: int = 0, pad: int = 0, 
+              inline: bool = False, order: str = '', 
+              from_center: list = []) -> Iterator[str]:
+    """
+Wraps text to the terminal width one line at a time, like
+wrap_text but without building the whole result first
+
+Args:
+    text (str | file-like): Text, or an open text file read
+                            in chunks
+    indent (int): Spaces before every continuation line
+    pad (int): Spaces before the first line (overrides 
+               order)
+    inline (bool): If True, order is printed elsewhere and
+                   only reserves its width
+    order (str): Ordered list tag (e.g., '1.', 'IV.')
+    from_center (list): [hue, line, line_hue, total_pad] 
+                        to center every line instead
+
+Returns:
+    Iterator[str]: Wrapped lines, without newlines
+    """
     # Validate parameters
     validate(
-      [[text, order], str, "string"],
+      [order, str, "string"],
       [[indent, pad], int, "natural number","less",0],
       [inline, bool, "boolean"],
-      [from_center, list, "list"], err=__err__)
+      [[from_center], list, "list"], err=__err__)
     
+    if isinstance(text, str): text = io.StringIO(text)
+    elif not callable(getattr(text, "read", None)):
+        __err__(text, "string or file-like object")
+    return _wrap(_words(text), indent, pad, inline, order,
+                 from_center)
+
+def _words(stream, size: int = 1 << 16) -> Iterator[str]:
+    # Whitespace-separated words of a text stream, holding
+    # back a word cut off at the end of a chunk
+    tail = ""
+    for chunk in iter(partial(stream.read, size), ""):
+        words = (tail + chunk).split()
+        tail  = "" if chunk[-1].isspace() or not words else (
+                words.pop())
+        yield from words
+    if tail: yield tail
+
+def _wrap(words: Iterator[str], indent: int, pad: int, 
+          inline: bool, order: str, from_center: list
+          ) -> Iterator[str]:
     width = logictools.get_term_size()
-    styled_words = text.split()
     
     if from_center:
         h, l, lh, total_pad = from_center
         width -= total_pad
-        centered, res = "", ""
-        pos = 0
+        center = Align().center
+    
+    margin, step   = _margin(order, inline)
+    head, line_len = _head(order, inline, pad)
+    if from_center: words = _cut(words, max(int(width - 
+                                 margin), 1))
+    
+    # Lines are kept as lists of parts so each word is
+    # measured and copied once
+    line = [head]
+    filled, group, broke = bool(head), [], False
+    for word in words:
+        size = logictools.visual_width(word)
+        if line_len + size + margin > width:
+            if from_center: yield center(" ".join(group
+                ).strip(), line=l, hue=h, line_hue=lh)
+            else: yield "".join(line)
+            line, group = [" " * indent, word], [word]
+            line_len = indent + size
+            filled = broke = True
+        else:
+            if filled: line.append(" ")
+            line.append(word)
+            group.append(word)
+            filled = True
+            line_len += size + step
     
+    if not from_center: yield "".join(line)
+    else: yield center((" " if group and not broke else "") 
+                       + " ".join(group), l, h, lh)
+
+def _cut(words: Iterator[str], width: int) -> Iterator[str]:
+    # Splits words wider than width into width-column pieces,
+    # so a centered line always fits and never re-wraps
+    for word in words:
+        if logictools.visual_width(word) <= width: 
+            yield word
+            continue
+        # Cut between characters, never through a wide one
+        cuts, col = [0], 0
+        for ch in logictools.strip_ansi(word):
+            size = logictools.char_width(ch)
+            if col > cuts[-1] and col + size - cuts[-1] > width:
+                cuts.append(col)
+            col += size
+        cuts.append(col)
+        for start, end in zip(cuts, cuts[1:]):
+            yield slice_columns(word, start, end)
+
+def _margin(order: str, inline: bool) -> tuple:
     # Adjust margin based on length of order
     # order is a tag for an ordered list (e.g., 1., a., 
     # IV., 10. etc)
@@ -142,64 +689,141 @@ def wrap_text(text: str, indent: int = 0, pad: int = 0,
         ) if not inline else 0
     if length>9 and not inline: trailing = length*2/10
     margin = 1 + trailing
-    
-    # Insert line breaks
-    line_len = len(order)
-    result = order if not inline else ""
-    
-    if pad:
-        result = " " * (pad-1)
-        line_len = pad
-    
-    for i, word in enumerate(styled_words):
-        used = line_len + visual_width(word)
-        if used + margin > width:
-            if from_center:
-                text = " ".join(styled_words[pos:i])
-                centered += align.center(text.strip(), 
-                    line=l, hue=h, line_hue=lh) + "\n"
-                pos = i
-                res = word
-            else: result += '\n' + ' ' * indent + word
-            line_len = indent + visual_width(word)
-        else:
-            result += (' ' if result else '') + word
-            if from_center: res += ' ' + word
-            line_len += visual_width(word) + (margin / 
-                (2 if margin >= 2 else 1))
-                
-    if not from_center: return result
-    return centered + align.center(res, l, h, lh)
+    return margin, margin / (2 if margin >= 2 else 1)
+
+def _head(order: str, inline: bool, pad: int) -> tuple:
+    # Text the first line starts with and its length
+    if pad: return " " * (pad-1), pad
+    return order if not inline else "", len(order)
+
+class Paragraph:
+    """
+A wrapped paragraph that survives terminal resizes. Words
+are measured once and the breaks of the last few widths 
+are kept, so a new width only re-flows the lines from the
+first one that moved. Lines match wrap_text at that width
+
+Args:
+    text (str): Paragraph text
+    indent, pad, inline, order: As for wrap_text
+    keep (int): Number of widths to remember
+    """
+    def __init__(self, text: str, indent: int = 0, 
+                 pad: int = 0, inline: bool = False,
+                 order: str = '', keep: int = 8):
+        validate(
+          [[text, order], str, "string"],
+          [[indent, pad], int, "natural number","less",0],
+          [keep, int, "positive integer", "eqless", 0],
+          [inline, bool, "boolean"], err=__err__)
+
+        self.words  = text.split()
+        self.sizes  = [logictools.visual_width(word) for 
+                       word in self.words]
+        self.indent = indent
+        self.margin, self.step = _margin(order, inline)
+        self.head,  self.start = _head(order, inline, pad)
+        self.keep   = keep
+        self._flows = OrderedDict()
+
+    def lines(self, width: int | None = None) -> tuple[str]:
+        """Returns the wrapped lines (default: term width)"""
+        if width is None: width = logictools.get_term_size()
+        flow = self._flow(width)
+        if flow["lines"] is None:
+            words, starts = self.words, flow["starts"]
+            ends  = starts[1:] + [len(words)]
+            first = " ".join(words[:ends[0]])
+            lines = [self.head + (" " if self.head and first
+                     else "") + first]
+            lines.extend(" " * self.indent + " ".join(words[
+                start:end]) for start, end in zip(starts[1:],
+                ends[1:]))
+            flow["lines"] = tuple(lines)
+        return flow["lines"]
+
+    def center(self, width: int | None = None, line: str = 
+               " ", hue: str = "", line_hue: str = ""
+               ) -> tuple[str]:
+        """Returns the lines, each centered within width"""
+        if width is None: width = logictools.get_term_size()
+        key  = (line, hue, line_hue)
+        flow = self._flow(width)
+        if key not in flow:
+            centered = []
+            for text in self.lines(width):
+                text  = text.strip()
+                total = max(width - logictools.visual_width(
+                        text), 0)
+                left  = total // 2
+                centered.append(style_text(line * left, 
+                    line_hue) + style_text(text, hue) + 
+                    style_text(line * (total - left), 
+                    line_hue))
+            flow[key] = tuple(centered)
+        return flow[key]
+
+    def _flow(self, width: int) -> dict:
+        # Line starts (word indices) for width. Each line 
+        # also keeps the widths it holds for, [fits, overs),
+        # so the latest flow's lines are reused up to the
+        # first one that no longer holds
+        flows = self._flows
+        if width in flows:
+            flows.move_to_end(width)
+            return flows[width]
+
+        starts, fits, overs, k = [0], [], [], 0
+        if flows:
+            last = flows[next(reversed(flows))]
+            while k < len(last["fits"]) - 1 and last["fits"][
+                  k] <= width < last["overs"][k]: k += 1
+            starts = last["starts"][:k + 1]
+            fits, overs = last["fits"][:k], last["overs"][:k]
+
+        sizes, margin, step = self.sizes, self.margin, self.step
+        i, fit = starts[-1], -inf
+        if k: line_len, i = self.indent + sizes[i], i + 1
+        else: line_len = self.start
+        
+        for i in range(i, len(sizes)):
+            check = line_len + sizes[i] + margin
+            if check > width:
+                starts.append(i)
+                fits.append(fit)
+                overs.append(check)
+                line_len, fit = self.indent + sizes[i], -inf
+            else:
+                fit = check
+                line_len += sizes[i] + step
+        fits.append(fit)
+        overs.append(inf)
+
+        flows[width] = {"starts": starts, "fits": fits, 
+                        "overs": overs, "lines": None}
+        if len(flows) > self.keep: flows.popitem(last=False)
+        return flows[width]
+
+@lru_cache(maxsize=64)
+def layout(text: str, indent: int = 0, pad: int = 0, 
+           inline: bool = False, order: str = '') -> Paragraph:
+    """Returns the shared Paragraph for text and options"""
+    return Paragraph(text, indent, pad, inline, order)
 
 def has_unicode(s: str) -> bool:
-    strip_ansi(s)
-    for ch in s:
-        if isunicode(ch): return True
-    return False
+    if not isinstance(s, str): __err__(s, "string") 
+    return logictools.has_codes(s)
 
 def isunicode(s: str) -> bool:
-    strip_ansi(s)
-    return ord(s) in [9, 10, 13, 27]
+    if not isinstance(s, str): __err__(s, "string") 
+    return ord(s) in (9, 10, 13, 27)
 
 def preserve_codes(s: str) -> str:
-    strip_ansi(s)
-    codes = {
-          "\n": "\\n",
-          "\r": "\\r",
-          "\t": "\\t",
-        "\x1b": "\\x1b"
-    }
-        
-    preserved = [ch for ch in s]
-    for c, r in codes.items():
-        for i, ch in enumerate(preserved):
-            if ch == c: preserved[i] = r
-                
-    return "".join(preserved)
+    if not isinstance(s, str): __err__(s, "string") 
+    return logictools.preserve_codes(s)
 
 def label(iterable: list|tuple|dict, hue: str = "cyan") -> list:
-    return [style_text(head, fg=hue) for head in 
-            iterable]
+    return style_many(iterable, hue)
 
 def iter_print(text, times: int, end: str = "\n", 
                delay: int | float = 0):
@@ -213,7 +837,7 @@ def iter_print(text, times: int, end: str = "\n",
     
     for _ in range(times):
         time.sleep(delay)
-        print(text, end=end, flush=True)
+        sink.echo(text, end=end, flush=True)
 
 def pad_args(*args) -> list[str]:
     return [str(n).zfill(2) for n in args]
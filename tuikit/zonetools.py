@@ -1,11 +1,86 @@
 from tuikit.exceptions import TimeError, InputError
-from tuikit.__storage__ import CONTS, FILES, load
-from tuikit.listools import flatten, list_items
+from tuikit import __storage__ as storage
+from tuikit.__storage__ import PosixRule, EPOCH, EPOCH_DAY
+from tuikit.__storage__ import _ttype
+from tuikit import sink
+from tuikit.listools import list_items
 from tuikit.console import underline
 from tuikit.textools import Align
 from datetime import datetime, timedelta, tzinfo
+from bisect import bisect_right
+from collections.abc import Iterator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, Counter, deque
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from threading import Lock
+from array import array
+import json
+import csv
+import re
+
+ALIGN = Align()
+
+# A CSV cell holding epoch seconds (e.g., "1174648500" or 
+# "-12.5") rather than an ISO timestamp
+EPOCH_CELL = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)")
+
+def _seconds_of(dt: datetime) -> int:
+    # Wall clock fields of dt as seconds since the epoch
+    return ((dt.toordinal() - EPOCH_DAY) * 86400 + dt.hour * 
+            3600 + dt.minute * 60 + dt.second)
+
+class _LRU:
+    """Bounded least-recently-used cache with hit/miss stats"""
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.data    = OrderedDict()
+        self.lock    = Lock()
+        self.hits    = self.misses = 0
+
+    def get(self, key, make):
+        with self.lock:
+            try:
+                value = self.data[key]
+                self.data.move_to_end(key)
+                self.hits += 1
+                return value
+            except KeyError: self.misses += 1
+
+        value = make()
+        with self.lock:
+            value = self.data.setdefault(key, value)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+        return value
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self.data), 
+                "maxsize": self.maxsize}
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = 0
 
 class Timezone():
+    # Equal zones share one Timezone and equal offsets
+    # share one ZoneInfo, so treat both as read-only
+    _cache  = _LRU(256)
+    _finder = None
+
+    def __new__(cls, zone: str|int|float = "CAT"):
+        def make():
+            self = super(Timezone, cls).__new__(cls)
+            self.__init__(zone)
+            return self
+
+        try: return cls._cache.get((cls, type(zone), zone), 
+                    make)
+        except TypeError: return make()
+
     def __init__(self, zone: str|int|float = "CAT"):
         """
 Initializes a Timezone object with the specified timezone
@@ -14,33 +89,162 @@ Args:
     zone: The timezone identifier (default is "CAT").
           Can be an IANA timezone (e.g., "Africa/
           Harare"), an abbreviation (e.g., "CAT") or 
-          UTC offset
-        
+          UTC offset. IANA zones follow their DST
+          rules; abbreviations and offsets stay fixed
 
 Raises:
     TimeError: If the timezone is not recognized
         """
+        if "zone" in self.__dict__: return
         self.offset = self.get_offset(zone)
-        self.zone = self.ZoneInfo(self.offset)
-        self.name = self.zone.tzname(datetime.now())
-        self.center = Align().center
+        rules = storage.rules(zone) if isinstance(zone, str
+                ) and "/" in zone else None
+        self.zone = self.ZoneRules(rules["zone"]) if rules else (
+                    self.ZoneInfo(self.offset))
+        self.name = self.zone.tzname(None)
+        self.center = ALIGN.center
         if isinstance(zone, str): self.name = zone
 
+    def __reduce__(self):
+        numeric = self.zone.fixed and self.name == self.zone.name
+        return self.__class__, (self.offset if numeric else 
+               self.name,)
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """Returns hit/miss stats of the interning caches"""
+        return {"timezone": cls._cache.info(),
+                "zoneinfo": cls.ZoneInfo._cache.info(),
+                "zonerules": cls.ZoneRules._cache.info()}
+
+    @classmethod
+    def cache_clear(cls):
+        cls._cache.clear()
+        cls.ZoneInfo._cache.clear()
+        cls.ZoneRules._cache.clear()
+
     class ZoneInfo(tzinfo):
-        def __init__(self, offset):
-            self.offset = timedelta(hours=offset)
+        __slots__ = ("hours", "offset", "name")
+        _cache    = _LRU(128)
+        fixed     = True
+
+        def __new__(cls, offset):
+            def make():
+                self = super(Timezone.ZoneInfo, cls
+                       ).__new__(cls)
+                self.hours  = offset
+                self.offset = timedelta(hours=offset)
+                self.name   = self._format(self.offset)
+                return self
+
+            try: return cls._cache.get((cls, offset), make)
+            except TypeError: return make()
+
+        def __reduce__(self):
+            return self.__class__, (self.hours,)
 
         def utcoffset(self, dt): return self.offset
 
         def dst(self, dt): return timedelta(0)
 
-        def tzname(self, dt):
-            total_min = self.offset.total_seconds()/60
+        def tzname(self, dt): return self.name
+
+        def seconds(self, ts: float) -> float: 
+            return self.hours * 3600
+
+        @staticmethod
+        def _format(offset: timedelta) -> str:
+            total_min = offset.total_seconds()/60
             hrs = int(total_min // 60)
             mins = int(abs(total_min) % 60)
             pn = "+" if hrs >= 0 else "-"
             return f"UTC{pn}{abs(hrs):02d}:{mins:02d}"
 
+    class ZoneRules(tzinfo):
+        """
+DST-aware tzinfo for an IANA zone: a bisect over its bundled
+transition table, then its POSIX DST rule (if any) past the
+end of the table
+        """
+        __slots__ = ("name", "times", "types", "kinds", 
+                     "after", "walls")
+        _cache    = _LRU(128)
+        fixed     = False
+
+        def __new__(cls, zone: str):
+            def make():
+                rules = storage.rules(zone)
+                self  = super(Timezone.ZoneRules, cls
+                        ).__new__(cls)
+                self.name  = rules["zone"]
+                self.times = rules["times"]
+                self.types = [_ttype(*t) for t in rules["types"]]
+                self.kinds = [self.types[k] for k in rules[
+                              "index"]]
+                after = PosixRule(rules["footer"] or "UTC0")
+                self.after = after if after.dst else None
+                self.walls = self._walls()
+                return self
+
+            return cls._cache.get((cls, zone), make)
+
+        def __reduce__(self):
+            return self.__class__, (self.name,)
+
+        def utcoffset(self, dt): 
+            return None if dt is None else self.find(dt)[0]
+
+        def dst(self, dt):
+            return None if dt is None else self.find(dt)[1]
+
+        def tzname(self, dt):
+            return self.name if dt is None else self.find(dt)[2]
+
+        def fromutc(self, dt):
+            if dt.tzinfo is not self:
+                raise ValueError("fromutc: dt.tzinfo is not self")
+            kind, fold = self.at_utc(_seconds_of(dt), dt.year)
+            dt += kind[0]
+            return dt.replace(fold=1) if fold else dt
+
+        def seconds(self, ts: float) -> int:
+            """UTC offset in seconds at a UTC epoch time"""
+            return self.at_utc(ts)[0][3]
+
+        def find(self, dt: datetime) -> tuple:
+            # Type in effect at a local (wall clock) time
+            ts    = _seconds_of(dt)
+            walls = self.walls[dt.fold]
+            if self.after and (not walls or ts > walls[-1]):
+                return self.after.at_local(ts, dt.year, dt.fold)
+            idx   = bisect_right(walls, ts)
+            return self.kinds[idx-1] if idx else self.types[0]
+
+        def at_utc(self, ts: float, year: int|None = None
+                   ) -> tuple:
+            # Type in effect at a UTC time, and whether that
+            # local time repeats (fold)
+            times = self.times
+            if self.after and (not times or ts > times[-1]):
+                return self.after.at_utc(ts, year)
+            idx   = bisect_right(times, ts)
+            if not idx: return self.types[0], False
+            kind  = self.kinds[idx-1]
+            prev  = self.kinds[idx-2] if idx > 1 else self.types[0]
+            return kind, prev[3] - kind[3] > ts - times[idx-1]
+
+        def _walls(self) -> tuple[list, list]:
+            # Transition times as local wall clock readings:
+            # [0] uses the later, [1] the earlier reading of
+            # each gap or fold, matching datetime.fold
+            walls, prev = ([], []), self.types[0][3]
+            for ts, kind in zip(self.times, self.kinds):
+                lo, hi = sorted((prev, kind[3]))
+                walls[0].append(ts + hi)
+                walls[1].append(ts + lo)
+                prev = kind[3]
+            return walls
+
     def get_offset(self, tz:str|int|float)->int|float:
         def error():
             raise TimeError(cause=tz, required=
@@ -51,28 +255,22 @@ Raises:
         if isinstance(tz, (int, float)): 
             if abs(tz) < 24: return tz
             error()
+        
         try: 
-            if "/" not in tz:
-                tz = load("aliases.json")[tz.upper()]
+            ofs = storage.offset(tz if "/" in tz else tz.upper())
+            if ofs is None: raise KeyError(tz)
+            return ofs
         except (KeyError, TypeError):
-            if tz.startswith("UTC"):
+            if isinstance(tz, str) and tz.startswith("UTC"):
                 try: 
                     ofs = float(tz[3:])
                     if abs(ofs) < 24: return ofs
                 except ValueError: pass
-            error()            
-            
-        info = tz.split("/")  
-        tz = '/'.join(info)
-        cont = info[0]
-        for tz_cont, file in zip(CONTS, FILES):
-            if cont == tz_cont:
-                try: return load(file)[tz]
-                except KeyError: break
-        error()
+            error()
                                 
     def list_zones(self, aliased: bool = False,
-              sort: str = "", getter: bool = False):
+              sort: str = "", getter: bool = False,
+              fuzzy: bool = False):
         """
 Lists or returns available timezones or aliases
 
@@ -83,6 +281,9 @@ Args:
                    printing
     sort (str): filter list by continent or 
                 abbreviation
+    fuzzy (bool): If True, sort is a fuzzy search (e.g., 
+                  'harare') and results are ranked by
+                  best match instead of name
 
 Returns:
     list[str] (if getter=True): Sorted list of zones/
@@ -92,30 +293,88 @@ Returns:
             raise InputError(cause=sort, required=
                 f"filter for {chosen}")
         
-        timezones = flatten([
-            load(file).keys() for file in FILES if not 
-            file.startswith("a")
-        ])
-        aliases = list(load("aliases.json").keys())
-        
         chosen = "aliases" if aliased else "timezones"
         
-        try: sort = sort.upper() if aliased else sort
-        except AttributeError: error()
-        
-        temp = aliases if aliased else timezones        
-        filt = [s for s in temp if s.startswith(sort)]
+        if not isinstance(sort, str): error()
+        if fuzzy: filt = [name for name in self.search(sort, 
+                  20) if aliased != ("/" in name)]
+        else: filt = self.match_zones(sort, aliased)
         if not filt: error()        
-        if getter: return sorted(filt)
+        if getter: return list(filt)
         
         header = self.center(f"《 {chosen.upper()} 》", 
                  "—", "magenta", "green")
         
-        print(f"\n{header}\n\n")
-        list_items(sorted(filt))
-        print()
+        sink.echo(f"\n{header}\n\n")
+        list_items(list(filt))
+        sink.echo()
         underline(hue="magenta")
     
+    @staticmethod
+    def match_zones(prefix: str = "", aliased: bool = False
+                    ) -> storage.NameSlice:
+        """
+Returns a lazy, already sorted view of the zones (or the
+aliases, matched case-insensitively) starting with prefix
+        """
+        if aliased: prefix = prefix.upper()
+        return storage.match(prefix, aliased)
+
+    def zones_at(self, tz: str|int|float|None = None, 
+                 at: datetime|str|float|None = None
+                 ) -> tuple[str, ...]:
+        """
+Returns every zone and alias sharing a UTC offset. Without
+at, zones are grouped by their standard (non-DST) offset,
+served from an index built once for all offsets; with at,
+by the offset each zone keeps at that instant
+
+Args:
+    tz: A UTC offset (e.g., 2 or 'UTC+2') or a zone whose
+        offset to use (default is this zone's)
+    at: A datetime or ISO string (naive ones read as this
+        zone's time) or UTC epoch seconds
+
+Returns:
+    tuple[str]: Sorted zones followed by sorted aliases
+
+Raises:
+    TimeError: If tz or at is not recognized
+        """
+        if at is None: return storage.sharing(self.offset if 
+                              tz is None else self.get_offset(tz))
+        if isinstance(at, (datetime, str)):
+            at = self.localize(at).timestamp()
+        elif not isinstance(at, (int, float)):
+            raise TimeError(cause=at, required="datetime, iso "
+                  "string or epoch seconds")
+        source = self if tz is None else Timezone(tz)
+        target = source.zone.seconds(at)
+
+        # Aliases keep fixed offsets (see __init__)
+        return tuple(name for name in storage.zones() if 
+               storage.offset_at(name, at) == target) + tuple(
+               name for name in storage.aliases() if 
+               storage.offset(name) is not None and 
+               storage.offset(name) * 3600 == target)
+
+    @classmethod
+    def search(cls, query: str, limit: int = 10) -> list[str]:
+        """
+Fuzzy-finds zones and aliases for autocomplete, e.g. 
+"harare", "harrae" or "hrr" -> ["Africa/Harare", ...]
+        """
+        if cls._finder is None: cls._finder = ZoneFinder(
+           storage.zones() + storage.aliases())
+        return cls._finder.search(query, limit)
+
+    @staticmethod
+    def reload():
+        """Rebuilds the zone index after tzdata changes"""
+        storage.reload()
+        Timezone.cache_clear()
+        Timezone._finder = None
+
     @property
     def now(self) -> datetime:
         """Returns the current datetime in the configured zone"""
@@ -166,6 +425,98 @@ Supports:
             req = "datetime object"
             raise TimeError(cause=dt, required=req)
 
+    def converter(self, to: str|int|float) -> "Converter":
+        """
+Returns a reusable callable converting from this zone to
+another, with both offsets resolved once. Call it with a
+datetime/ISO string or with any iterable of them (the
+latter is converted lazily)
+        """
+        return Converter(self, Timezone(to))
+
+    def localize_column(self, column, out: str = "epoch"
+                        ) -> array | list:
+        """
+Localizes a whole column of timestamps in one pass
+
+Args:
+    column: A list/tuple of ISO strings, datetimes or epoch
+            seconds, or an array('d') of epoch seconds.
+            Naive values are read as this zone's time
+    out: What to return the column as:
+         "epoch"    - array('d') of UTC epoch seconds
+         "wall"     - array('d') of wall-clock seconds in
+                      this zone (epoch + offset)
+         "datetime" - list of aware datetimes
+         "iso"      - list of ISO strings
+
+Raises:
+    TimeError: If a value is not a timestamp
+    InputError: If out is not one of the above
+        """
+        self._output(out)
+        return self._emit(self._epochs(column), self, out)
+
+    def convert_column(self, column, to: str|int|float, 
+                       out: str = "epoch") -> array | list:
+        """
+Converts a whole column of timestamps to another zone
+Takes the same column and out values as localize_column
+        """
+        target = Timezone(to)
+        self._output(out)
+        return self._emit(self._epochs(column), target, out)
+
+    @staticmethod
+    def _output(out: str) -> None:
+        # Checked before any value is parsed, so a bad out
+        # fails fast instead of after a whole column
+        if out not in ("epoch", "wall", "datetime", "iso"):
+            raise InputError(cause=out, required="column "
+                  +"output ('epoch', 'wall', 'datetime' or "
+                  +"'iso')")
+
+    def _epochs(self, column) -> array:
+        if isinstance(column, array) and column.typecode == "d":
+            return column
+        
+        zone   = self.zone
+        naive  = self.offset * 3600 if zone.fixed else None
+        epochs = array("d")
+        append = epochs.append
+        parse  = datetime.fromisoformat
+        for value in column:
+            if isinstance(value, (int, float)):
+                append(value)
+                continue
+            try: 
+                dt = parse(value) if isinstance(value, str
+                     ) else value
+                if dt.tzinfo is not None: append(dt.timestamp())
+                elif naive is None: append((dt - EPOCH
+                     ).total_seconds() - zone.find(dt)[3])
+                else: append((dt - EPOCH).total_seconds() - naive)
+            except (ValueError, TypeError, AttributeError):
+                raise TimeError(cause=value, required="iso "
+                    +"string, datetime object or epoch "
+                    +"seconds") from None
+        return epochs
+
+    @staticmethod
+    def _emit(epochs: array, tz, out: str) -> array | list:
+        if out == "epoch": return array("d", epochs)
+        if out == "wall" and tz.zone.fixed:
+            shift = tz.offset * 3600
+            return array("d", [e + shift for e in epochs])
+        if out == "wall":
+            shift = tz.zone.seconds
+            return array("d", [e + shift(e) for e in epochs])
+
+        stamp, zone = datetime.fromtimestamp, tz.zone
+        if out == "datetime": 
+            return [stamp(e, zone) for e in epochs]
+        return [stamp(e, zone).isoformat() for e in epochs]
+
     @property
     def iso_now(self) -> str:
         """Returns ISO string of the current time in this zone"""
@@ -179,6 +530,239 @@ Both will be localized to self.zone before subtraction
         dt1, dt2 = self.localize(dt1, dt2)
         return (dt2 - dt1).total_seconds()
 
+class Converter:
+    """
+Zone-to-zone converter built by Timezone.converter(to)
+Naive values are read as source-zone time, as localize does.
+Between fixed-offset zones a conversion is one timedelta
+add; DST-aware zones go through their transition tables
+    """
+    def __init__(self, source: Timezone, target: Timezone):
+        self.source = source
+        self.target = target
+        self.fixed  = source.zone.fixed and target.zone.fixed
+        self.delta  = timedelta(hours=target.offset - 
+                      source.offset)
+
+    def __call__(self, value) -> datetime | Iterator[datetime]:
+        if isinstance(value, (datetime, str)): 
+            return self.convert(value)
+        try: values = iter(value)
+        except TypeError: self._error(value)
+        return map(self.convert, values)
+
+    def convert(self, dt: datetime | str) -> datetime:
+        if isinstance(dt, str):
+            try: dt = datetime.fromisoformat(dt)
+            except ValueError: self._error(dt)
+        elif not isinstance(dt, datetime): self._error(dt)
+
+        tz = dt.tzinfo
+        if tz is None or tz is self.source.zone:
+            if self.fixed: return (dt + self.delta).replace(
+                           tzinfo=self.target.zone)
+            dt = dt.replace(tzinfo=self.source.zone)
+        return dt.astimezone(self.target.zone)
+
+    @staticmethod
+    def _error(dt):
+        raise TimeError(cause=dt, required="iso string "
+              +"(YYYY-MM-DD) or datetime object")
+
+class ZoneFinder:
+    """
+Fuzzy finder over zone names and aliases. Tolerates typos,
+matches subsequences and bare cities ("harare" -> 
+"Africa/Harare"), ranking candidates pulled from a trigram
+index of city names that is built once. A query holding a
+"/" (e.g., "america/new yrk") keeps to that region
+    """
+    POOL = 24 # candidates scored in full per query
+
+    def __init__(self, names: Iterable[str]):
+        self.names  = tuple(names)
+        self.cities = []
+        self.scopes = []
+        self.grams  = {}
+        self.heads  = {}
+        for i, name in enumerate(self.names):
+            scope, _, city = self._norm(name).rpartition("/")
+            grams = self._grams(city)
+            self.cities.append((city, grams))
+            self.scopes.append(scope)
+            self.heads.setdefault(city[:1], []).append(i)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(i)
+
+    def search(self, query: str, limit: int = 10
+               ) -> list[str]:
+        """Returns up to limit names, best match first"""
+        scope, _, query = self._norm(query).rpartition("/")
+        if not query: return []
+        
+        grams = self._grams(query)
+        hits  = Counter()
+        for gram in grams: hits.update(self.grams.get(gram, 
+                                       ()))
+        pool = dict.fromkeys(i for i, _ in hits.most_common(
+               self.POOL))
+        # Short or mangled queries share few trigrams, so
+        # also try the cities starting with the same letter
+        if len(pool) < limit:
+            pool.update(dict.fromkeys(self.heads.get(
+                query[0], ())))
+
+        ranked = []
+        for i in pool:
+            if not self.scopes[i].startswith(scope): continue
+            score = self._score(query, grams, *self.cities[i])
+            if score: ranked.append((-score, self.names[i]))
+        return [name for _, name in sorted(ranked)[:limit]]
+
+    @staticmethod
+    def _norm(name: str) -> str:
+        return name.strip().lower().replace("_", " ")
+
+    @staticmethod
+    def _grams(key: str) -> frozenset[str]:
+        key = f" {key} "
+        return frozenset(key[i:i+3] for i in range(len(key) 
+               - 2))
+
+    def _score(self, query: str, qgrams: frozenset, key: str,
+               grams: frozenset) -> float:
+        if key == query: return 1.0
+        if key.startswith(query): 
+            return 0.9 + 0.05 * len(query) / len(key)
+        if query in key: return 0.8
+        
+        allowed = max(1, len(query) // 4)
+        if abs(len(key) - len(query)) <= allowed and len(set(
+           query) ^ set(key)) <= 2 * allowed:
+            typos = self._distance(query, key, allowed)
+            if typos <= allowed: return 0.7 - 0.1 * typos
+        
+        chars = iter(key)
+        if all(ch in chars for ch in query):
+            return 0.5 + 0.1 * len(query) / len(key)
+        
+        # Anything else only ranks by shared trigrams, and
+        # too few of them is noise rather than a match
+        shared = len(qgrams & grams) / len(qgrams)
+        return 0.4 * shared if shared >= 0.5 else 0.0
+
+    @staticmethod
+    def _distance(a: str, b: str, cap: int) -> int:
+        # Levenshtein distance with adjacent swaps counted
+        # as one edit, giving up once every cell is > cap
+        prev2, prev = None, list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            row = [i]
+            for j, cb in enumerate(b, 1):
+                cost = min(prev[j] + 1, row[j-1] + 1, 
+                       prev[j-1] + (ca != cb))
+                if prev2 and i > 1 and j > 1 and ca == b[j-2
+                   ] and a[i-2] == cb:
+                    cost = min(cost, prev2[j-2] + 1)
+                row.append(cost)
+            if min(row) > cap: return cap + 1
+            prev2, prev = prev, row
+        return prev[-1]
+
+def localize_file(src: str, dst: str, column: str, 
+                  zone: str|int|float = "CAT", 
+                  to: str|int|float|None = None,
+                  fmt: str|None = None, workers: int = 0, 
+                  chunk: int = 10_000) -> int:
+    """
+Streams a CSV or JSONL file row by row, localizing (or
+converting) one timestamp column and writing each chunk
+out as soon as it is done, so memory stays flat no matter
+how big the file is
+
+Args:
+    src (str): Path of the CSV/JSONL file to read
+    dst (str): Path to write the result to
+    column (str): CSV header or JSONL key of the timestamps:
+                  ISO strings, or epoch seconds (JSON 
+                  numbers, or CSV cells of digits only)
+    zone: Zone naive timestamps are read in
+    to: Zone to convert to. If None, localize in zone
+    fmt (str): "csv" or "jsonl". Guessed from src if None
+    workers (int): If above 1, chunks are fanned out to a
+                   process pool of that size
+    chunk (int): Rows per chunk
+
+Returns:
+    int: Number of rows written
+    """
+    fmt = fmt or Path(src).suffix.lstrip(".").lower()
+    if fmt not in ("csv", "jsonl"):
+        raise InputError(cause=fmt, required="file format "
+              +"('csv' or 'jsonl')")
+    Timezone(zone), Timezone(zone if to is None else to)
+
+    with open(src, newline="") as fin, open(dst, "w", 
+         newline="") as fout:
+        if fmt == "csv":
+            reader, writer = csv.reader(fin), csv.writer(fout)
+            header = next(reader, [])
+            try: key = header.index(column)
+            except ValueError:
+                raise InputError(cause=column, required=
+                      "column in the CSV header") from None
+            writer.writerow(header)
+            rows, write = reader, writer.writerows
+        else:
+            key   = column
+            rows  = (line for line in fin if line.strip())
+            write = fout.writelines
+
+        chunks  = iter(lambda: list(islice(rows, chunk)), [])
+        job     = partial(_localize_rows, zone, to, fmt, key)
+        written = 0
+        for done in _run_chunks(job, chunks, workers):
+            write(done)
+            written += len(done)
+    return written
+
+def _run_chunks(job, chunks, workers: int):
+    if workers <= 1:
+        yield from map(job, chunks)
+        return
+
+    # Keep a bounded window of chunks in flight so a huge
+    # file is never queued up in memory all at once
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for part in chunks:
+            pending.append(pool.submit(job, part))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending: yield pending.popleft().result()
+
+def _localize_rows(zone, to, fmt: str, key, rows: list
+                   ) -> list:
+    conv = Timezone(zone).converter(zone if to is None else 
+           to)
+    done = []
+    for row in rows:
+        if fmt == "jsonl": row = json.loads(row)
+        try: value = row[key]
+        except (KeyError, IndexError, TypeError):
+            raise InputError(cause=row, required="row with "
+                  +"a timestamp column") from None
+        if fmt == "csv" and EPOCH_CELL.fullmatch(value):
+            value = float(value)
+        if isinstance(value, (int, float)):
+            value = datetime.fromtimestamp(value, 
+                    conv.target.zone)
+        else: value = conv(value)
+        row[key] = value.isoformat()
+        done.append(row if fmt == "csv" else json.dumps(
+                    row) + "\n")
+    return done
+
 if __name__ == "__main__":
     tz = Timezone()
     print(tz.iso_now)